@@ -1,5 +1,6 @@
 import sys
 import time
+import asyncio
 import logging
 import threading
 from contextlib import asynccontextmanager
@@ -10,10 +11,13 @@ import tkinter as tk
 from tkinter import messagebox
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pystray import Icon, Menu, MenuItem
 from PIL import Image
 from config import load_config, Config
 from models.main_models import MainStatusResponse, MainRootResponse
+from utils.journal import watch_journals
+from utils.file_utils import watch_json_files
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +26,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# JSON files the game keeps rewriting alongside the journals
+JSON_FILE_NAMES = (
+    'Status.json', 'NavRoute.json', 'ModulesInfo.json', 'Cargo.json', 'Market.json',
+    'Shipyard.json', 'ShipLocker.json', 'Backpack.json'
+)
+
+# JSON files polled often enough to be kept parsed in memory
+WATCHED_JSON_FILES = ('Status.json', 'ModulesInfo.json', 'Shipyard.json', 'ShipLocker.json')
+
 
 def load_routes():
     """Dynamically load all route modules from the routes directory."""
@@ -65,8 +78,18 @@ async def lifespan(app: FastAPI):
     logger.info(f"Using log location: {app.state.json_location}")
     logger.info(f"API Language: {app.state.config.language}")
 
+    # Parse new journal lines in the background as the game writes them
+    journal_watcher = asyncio.create_task(watch_journals(app.state.json_location))
+    # Keep the polled JSON files parsed so requests never wait on the disk
+    json_watcher = asyncio.create_task(
+        watch_json_files(app.state.json_files[name] for name in WATCHED_JSON_FILES)
+    )
+
     yield
 
+    journal_watcher.cancel()
+    json_watcher.cancel()
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -74,7 +97,8 @@ app = FastAPI(
     description="API for accessing Elite Dangerous game data",
     version="2.0.0",
     lifespan=lifespan,
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 
@@ -104,6 +128,8 @@ def setup_app(config: Config):
     json_location = config.json_location if not config.debug else config.json_test_location
     app.state.config = config
     app.state.json_location = json_location
+    # Full paths of the JSON files, built once instead of on every request
+    app.state.json_files = {name: json_location / name for name in JSON_FILE_NAMES}
     app.state.server_running = False
 
     # Setup CORS
@@ -34,9 +34,9 @@ class MaterialsResponse(BaseModel):
 
     GET /materials/inventory
     """
-    Raw: List[MaterialItem]  # All raw materials (elements)
-    Manufactured: List[MaterialItem]  # All manufactured materials
-    Encoded: List[MaterialItem]  # All encoded data materials
+    Raw: List[MaterialItem] = Field(default_factory=list)  # All raw materials (elements)
+    Manufactured: List[MaterialItem] = Field(default_factory=list)  # All manufactured materials
+    Encoded: List[MaterialItem] = Field(default_factory=list)  # All encoded data materials
     timestamp: Optional[str] = None  # When this data was recorded
 
 
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 
@@ -16,6 +17,26 @@ class OrganicScan(BaseModel):
     was_logged: bool = False  # True if already logged by another commander
 
 
+@dataclass(slots=True)
+class OrganicScanRow:
+    """
+    Lightweight organic scan with the same fields as OrganicScan.
+
+    Used where many scans are built and serialized directly with orjson,
+    skipping model validation and the per-instance __dict__.
+    """
+    timestamp: Optional[str]
+    scan_type: str
+    genus: str
+    species: str
+    variant: Optional[str]
+    system_name: Optional[str]
+    system_address: Optional[int]
+    body_name: Optional[str]
+    body_id: Optional[int]
+    was_logged: bool
+
+
 class OrganicSummary(BaseModel):
     """Summary of organic scans"""
     total_analyse_scans: int = 0
@@ -43,3 +43,16 @@ class DetailedHealthResponse(BaseModel):
     Shields: float
     ShieldsUp: bool
 
+
+class SnapshotResponse(BaseModel):
+    """Response for every status value at once."""
+    Active: bool
+    Balance: str
+    flags: str
+    flags2: str
+    Focus: str
+    Pips: PipsResponse
+    Fuel: FuelResponse
+    Health: float
+    Shields: float
+    ShieldsUp: bool
@@ -1,28 +1,23 @@
 from fastapi import APIRouter, HTTPException, Request
-from pathlib import Path
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Dict, Any
 import logging
 
 from utils.file_utils import read_json_file
 from utils.journal import calculate_cargo_inventory
+from utils.app_state import get_json_location, get_json_file
 import lang.descriptions_en as desc
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/cargo", tags=["cargo"])
 
 
-def get_json_location(request: Request) -> Path:
-    """Get JSON location from app state."""
-    return request.app.state.json_location
-
-
 @router.get('/inventory', description=desc.CARGO_INVENTORY)
 async def get_cargo(request: Request) -> List[Dict[str, Any]]:
     """Get current cargo inventory."""
-    json_location = get_json_location(request)
-    cargo_file = json_location / 'Cargo.json'
+    cargo_file = get_json_file(request, 'Cargo.json')
 
-    data = read_json_file(cargo_file)
+    data = await run_in_threadpool(read_json_file, cargo_file)
     if not data:
         raise HTTPException(status_code=503, detail="Cannot read cargo file")
 
@@ -32,10 +27,9 @@ async def get_cargo(request: Request) -> List[Dict[str, Any]]:
 @router.get('/market')
 async def get_market(request: Request) -> List[Dict[str, Any]]:
     """Get current market data."""
-    json_location = get_json_location(request)
-    market_file = json_location / 'Market.json'
+    market_file = get_json_file(request, 'Market.json')
 
-    data = read_json_file(market_file)
+    data = await run_in_threadpool(read_json_file, market_file)
     if not data:
         raise HTTPException(status_code=503, detail="Cannot read market file")
 
@@ -49,5 +43,5 @@ async def get_transfer_history(request: Request) -> Dict[str, int]:
     Returns net quantities for each item type.
     """
     json_location = get_json_location(request)
-    inventory = calculate_cargo_inventory(json_location)
+    inventory = await run_in_threadpool(calculate_cargo_inventory, json_location)
     return inventory
@@ -12,7 +12,7 @@ from models.carrier_models import (
     CarrierCrewResponse
 )
 
-from utils.journal import get_latest_journal_file, parse_journal_line, find_latest_event
+from utils.journal import get_latest_journal_file, parse_journal_line, find_latest_event, iter_journal_lines
 import lang.descriptions_en as desc
 
 logger = logging.getLogger(__name__)
@@ -67,22 +67,21 @@ async def get_carrier_info(request: Request):
     timestamp = None
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
+        for line in iter_journal_lines(journal_file):
+            data = parse_journal_line(line)
+            if not data:
+                continue
 
-                event = data.get('event')
+            event = data.get('event')
 
-                if event == 'CarrierStats':
-                    carrier_stats = CarrierStatsResponse(**data)
-                    timestamp = data.get('timestamp')
+            if event == 'CarrierStats':
+                carrier_stats = CarrierStatsResponse(**data)
+                timestamp = data.get('timestamp')
 
-                elif event == 'CarrierJumpRequest':
-                    jump_request = CarrierJumpRequestResponse(**data)
-                    if not timestamp:
-                        timestamp = data.get('timestamp')
+            elif event == 'CarrierJumpRequest':
+                jump_request = CarrierJumpRequestResponse(**data)
+                if not timestamp:
+                    timestamp = data.get('timestamp')
 
         if not carrier_stats and not jump_request:
             raise HTTPException(status_code=404, detail="No carrier information found")
@@ -1,6 +1,5 @@
-from pathlib import Path
-
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Dict, Optional, Any
 import logging
 
@@ -17,8 +16,10 @@ from utils.file_utils import read_json_file
 from utils.journal import (
     get_latest_journal_file,
     get_all_journal_files,
-    parse_journal_line
+    parse_journal_line,
+    iter_journal_lines
 )
+from utils.app_state import get_json_file
 import lang.descriptions_en as desc
 
 logger = logging.getLogger(__name__)
@@ -49,49 +50,48 @@ async def get_current_commander_status(request: Request):
     timestamp = None
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                event = data.get('event')
-
-                if event == 'Rank':
-                    latest_rank = CommanderRank(
-                        timestamp=data.get('timestamp'),
-                        combat=data.get('Combat', 0),
-                        trade=data.get('Trade', 0),
-                        explore=data.get('Explore', 0),
-                        soldier=data.get('Soldier', 0),
-                        exobiologist=data.get('Exobiologist', 0),
-                        empire=data.get('Empire', 0),
-                        federation=data.get('Federation', 0),
-                        cqc=data.get('CQC', 0)
-                    )
-                    timestamp = data.get('timestamp')
-
-                elif event == 'Progress':
-                    latest_progress = CommanderProgress(
-                        timestamp=data.get('timestamp'),
-                        combat=data.get('Combat', 0),
-                        trade=data.get('Trade', 0),
-                        explore=data.get('Explore', 0),
-                        soldier=data.get('Soldier', 0),
-                        exobiologist=data.get('Exobiologist', 0),
-                        empire=data.get('Empire', 0),
-                        federation=data.get('Federation', 0),
-                        cqc=data.get('CQC', 0)
-                    )
-
-                elif event == 'Reputation':
-                    latest_reputation = CommanderReputation(
-                        timestamp=data.get('timestamp'),
-                        empire=data.get('Empire', 0.0),
-                        federation=data.get('Federation', 0.0),
-                        independent=data.get('Independent', 0.0),
-                        alliance=data.get('Alliance', 0.0)
-                    )
+        for line in iter_journal_lines(journal_file):
+            data = parse_journal_line(line)
+            if not data:
+                continue
+
+            event = data.get('event')
+
+            if event == 'Rank':
+                latest_rank = CommanderRank(
+                    timestamp=data.get('timestamp'),
+                    combat=data.get('Combat', 0),
+                    trade=data.get('Trade', 0),
+                    explore=data.get('Explore', 0),
+                    soldier=data.get('Soldier', 0),
+                    exobiologist=data.get('Exobiologist', 0),
+                    empire=data.get('Empire', 0),
+                    federation=data.get('Federation', 0),
+                    cqc=data.get('CQC', 0)
+                )
+                timestamp = data.get('timestamp')
+
+            elif event == 'Progress':
+                latest_progress = CommanderProgress(
+                    timestamp=data.get('timestamp'),
+                    combat=data.get('Combat', 0),
+                    trade=data.get('Trade', 0),
+                    explore=data.get('Explore', 0),
+                    soldier=data.get('Soldier', 0),
+                    exobiologist=data.get('Exobiologist', 0),
+                    empire=data.get('Empire', 0),
+                    federation=data.get('Federation', 0),
+                    cqc=data.get('CQC', 0)
+                )
+
+            elif event == 'Reputation':
+                latest_reputation = CommanderReputation(
+                    timestamp=data.get('timestamp'),
+                    empire=data.get('Empire', 0.0),
+                    federation=data.get('Federation', 0.0),
+                    independent=data.get('Independent', 0.0),
+                    alliance=data.get('Alliance', 0.0)
+                )
 
         if not latest_rank and not latest_progress and not latest_reputation:
             raise HTTPException(status_code=404, detail="No commander status found in journal")
@@ -130,24 +130,23 @@ async def get_current_rank(request: Request):
     latest_rank = None
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                if data.get('event') == 'Rank':
-                    latest_rank = CommanderRank(
-                        timestamp=data.get('timestamp'),
-                        combat=data.get('Combat', 0),
-                        trade=data.get('Trade', 0),
-                        explore=data.get('Explore', 0),
-                        soldier=data.get('Soldier', 0),
-                        exobiologist=data.get('Exobiologist', 0),
-                        empire=data.get('Empire', 0),
-                        federation=data.get('Federation', 0),
-                        cqc=data.get('CQC', 0)
-                    )
+        for line in iter_journal_lines(journal_file):
+            data = parse_journal_line(line)
+            if not data:
+                continue
+
+            if data.get('event') == 'Rank':
+                latest_rank = CommanderRank(
+                    timestamp=data.get('timestamp'),
+                    combat=data.get('Combat', 0),
+                    trade=data.get('Trade', 0),
+                    explore=data.get('Explore', 0),
+                    soldier=data.get('Soldier', 0),
+                    exobiologist=data.get('Exobiologist', 0),
+                    empire=data.get('Empire', 0),
+                    federation=data.get('Federation', 0),
+                    cqc=data.get('CQC', 0)
+                )
 
         if not latest_rank:
             raise HTTPException(status_code=404, detail="No rank data found")
@@ -181,24 +180,23 @@ async def get_current_progress(request: Request):
     latest_progress = None
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                if data.get('event') == 'Progress':
-                    latest_progress = CommanderProgress(
-                        timestamp=data.get('timestamp'),
-                        combat=data.get('Combat', 0),
-                        trade=data.get('Trade', 0),
-                        explore=data.get('Explore', 0),
-                        soldier=data.get('Soldier', 0),
-                        exobiologist=data.get('Exobiologist', 0),
-                        empire=data.get('Empire', 0),
-                        federation=data.get('Federation', 0),
-                        cqc=data.get('CQC', 0)
-                    )
+        for line in iter_journal_lines(journal_file):
+            data = parse_journal_line(line)
+            if not data:
+                continue
+
+            if data.get('event') == 'Progress':
+                latest_progress = CommanderProgress(
+                    timestamp=data.get('timestamp'),
+                    combat=data.get('Combat', 0),
+                    trade=data.get('Trade', 0),
+                    explore=data.get('Explore', 0),
+                    soldier=data.get('Soldier', 0),
+                    exobiologist=data.get('Exobiologist', 0),
+                    empire=data.get('Empire', 0),
+                    federation=data.get('Federation', 0),
+                    cqc=data.get('CQC', 0)
+                )
 
         if not latest_progress:
             raise HTTPException(status_code=404, detail="No progress data found")
@@ -232,20 +230,19 @@ async def get_current_reputation(request: Request):
     latest_reputation = None
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                if data.get('event') == 'Reputation':
-                    latest_reputation = CommanderReputation(
-                        timestamp=data.get('timestamp'),
-                        empire=data.get('Empire', 0.0),
-                        federation=data.get('Federation', 0.0),
-                        independent=data.get('Independent', 0.0),
-                        alliance=data.get('Alliance', 0.0)
-                    )
+        for line in iter_journal_lines(journal_file):
+            data = parse_journal_line(line)
+            if not data:
+                continue
+
+            if data.get('event') == 'Reputation':
+                latest_reputation = CommanderReputation(
+                    timestamp=data.get('timestamp'),
+                    empire=data.get('Empire', 0.0),
+                    federation=data.get('Federation', 0.0),
+                    independent=data.get('Independent', 0.0),
+                    alliance=data.get('Alliance', 0.0)
+                )
 
         if not latest_reputation:
             raise HTTPException(status_code=404, detail="No reputation data found")
@@ -287,25 +284,24 @@ async def get_rank_history(
 
     try:
         for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    if data.get('event') == 'Rank':
-                        rank = CommanderRank(
-                            timestamp=data.get('timestamp'),
-                            combat=data.get('Combat', 0),
-                            trade=data.get('Trade', 0),
-                            explore=data.get('Explore', 0),
-                            soldier=data.get('Soldier', 0),
-                            exobiologist=data.get('Exobiologist', 0),
-                            empire=data.get('Empire', 0),
-                            federation=data.get('Federation', 0),
-                            cqc=data.get('CQC', 0)
-                        )
-                        rank_events.append(rank)
+            for line in iter_journal_lines(journal_file):
+                data = parse_journal_line(line)
+                if not data:
+                    continue
+
+                if data.get('event') == 'Rank':
+                    rank = CommanderRank(
+                        timestamp=data.get('timestamp'),
+                        combat=data.get('Combat', 0),
+                        trade=data.get('Trade', 0),
+                        explore=data.get('Explore', 0),
+                        soldier=data.get('Soldier', 0),
+                        exobiologist=data.get('Exobiologist', 0),
+                        empire=data.get('Empire', 0),
+                        federation=data.get('Federation', 0),
+                        cqc=data.get('CQC', 0)
+                    )
+                    rank_events.append(rank)
 
         # Sort by timestamp
         rank_events.sort(key=lambda x: x.timestamp if x.timestamp else '')
@@ -353,25 +349,24 @@ async def get_progress_history(
 
     try:
         for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    if data.get('event') == 'Progress':
-                        progress = CommanderProgress(
-                            timestamp=data.get('timestamp'),
-                            combat=data.get('Combat', 0),
-                            trade=data.get('Trade', 0),
-                            explore=data.get('Explore', 0),
-                            soldier=data.get('Soldier', 0),
-                            exobiologist=data.get('Exobiologist', 0),
-                            empire=data.get('Empire', 0),
-                            federation=data.get('Federation', 0),
-                            cqc=data.get('CQC', 0)
-                        )
-                        progress_events.append(progress)
+            for line in iter_journal_lines(journal_file):
+                data = parse_journal_line(line)
+                if not data:
+                    continue
+
+                if data.get('event') == 'Progress':
+                    progress = CommanderProgress(
+                        timestamp=data.get('timestamp'),
+                        combat=data.get('Combat', 0),
+                        trade=data.get('Trade', 0),
+                        explore=data.get('Explore', 0),
+                        soldier=data.get('Soldier', 0),
+                        exobiologist=data.get('Exobiologist', 0),
+                        empire=data.get('Empire', 0),
+                        federation=data.get('Federation', 0),
+                        cqc=data.get('CQC', 0)
+                    )
+                    progress_events.append(progress)
 
         # Sort by timestamp
         progress_events.sort(key=lambda x: x.timestamp if x.timestamp else '')
@@ -419,21 +414,20 @@ async def get_reputation_history(
 
     try:
         for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    if data.get('event') == 'Reputation':
-                        reputation = CommanderReputation(
-                            timestamp=data.get('timestamp'),
-                            empire=data.get('Empire', 0.0),
-                            federation=data.get('Federation', 0.0),
-                            independent=data.get('Independent', 0.0),
-                            alliance=data.get('Alliance', 0.0)
-                        )
-                        reputation_events.append(reputation)
+            for line in iter_journal_lines(journal_file):
+                data = parse_journal_line(line)
+                if not data:
+                    continue
+
+                if data.get('event') == 'Reputation':
+                    reputation = CommanderReputation(
+                        timestamp=data.get('timestamp'),
+                        empire=data.get('Empire', 0.0),
+                        federation=data.get('Federation', 0.0),
+                        independent=data.get('Independent', 0.0),
+                        alliance=data.get('Alliance', 0.0)
+                    )
+                    reputation_events.append(reputation)
 
         # Sort by timestamp
         reputation_events.sort(key=lambda x: x.timestamp if x.timestamp else '')
@@ -490,15 +484,14 @@ async def get_rank_names(request: Request) -> Dict[str, Any]:
     latest_rank = None
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
+        for line in iter_journal_lines(journal_file):
+            data = parse_journal_line(line)
+            if not data:
+                continue
 
-                if data.get('event') == 'Rank':
-                    latest_rank = data
-                    break
+            if data.get('event') == 'Rank':
+                latest_rank = data
+                break
 
         if not latest_rank:
             raise HTTPException(status_code=404, detail="No rank data found")
@@ -549,13 +542,8 @@ async def get_rank_names(request: Request) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
-def get_json_location(request: Request) -> Path:
-    """Get JSON location from app state."""
-    return request.app.state.json_location
-
 def read_backpack_file(request: Request, file_to_read):
-    json_location = get_json_location(request)
-    status_file = json_location / file_to_read
+    status_file = get_json_file(request, file_to_read)
     data = read_json_file(status_file)
     return data
 
@@ -566,7 +554,7 @@ def read_backpack_file(request: Request, file_to_read):
     response_model=BackPackResponse,
 )
 async def get_backpack_contents(request: Request) -> BackPackResponse:
-    bpdata = read_backpack_file(request, 'Backpack.json')
+    bpdata = await run_in_threadpool(read_backpack_file, request, 'Backpack.json')
     if not bpdata:
         raise HTTPException(status_code=503, detail="Cannot read status file")
 
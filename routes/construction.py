@@ -3,7 +3,7 @@ import logging
 import traceback
 
 from models.construction_models import ConstructionResponse
-from utils.journal import get_latest_journal_file, parse_journal_line
+from utils.journal import get_latest_journal_file, parse_journal_line, iter_journal_lines
 import lang.descriptions_en as desc
 
 logger = logging.getLogger(__name__)
@@ -15,7 +15,7 @@ async def get_construction(request: Request):
     """Get current construction depot information."""
     try:
         json_location = request.app.state.json_location
-        logger.info(f"Looking for journal files in: {json_location}")
+        logger.debug("Looking for journal files in: %s", json_location)
 
         journal_file = get_latest_journal_file(json_location)
 
@@ -23,29 +23,28 @@ async def get_construction(request: Request):
             logger.warning("No journal file found")
             raise HTTPException(status_code=404, detail="No journal file found")
 
-        logger.info(f"Reading journal file: {journal_file}")
+        logger.debug("Reading journal file: %s", journal_file)
 
         construction_data = None
         market_id = None
         construction_complete = False
 
         try:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if data and data.get('event') == 'ColonisationConstructionDepot':
-                        construction_data = data.get('ResourcesRequired', [])
-                        market_id = data.get('MarketID')
-                        construction_complete = data.get('ConstructionComplete', False)
-                        logger.info(f"Found construction depot: MarketID={market_id}, Complete={construction_complete}")
-                        # Keep looking to find the most recent one
+            for line in iter_journal_lines(journal_file):
+                data = parse_journal_line(line)
+                if data and data.get('event') == 'ColonisationConstructionDepot':
+                    construction_data = data.get('ResourcesRequired', [])
+                    market_id = data.get('MarketID')
+                    construction_complete = data.get('ConstructionComplete', False)
+                    logger.debug("Found construction depot: MarketID=%s, Complete=%s", market_id, construction_complete)
+                    # Keep looking to find the most recent one
         except Exception as e:
             logger.error(f"Error reading construction data: {e}")
             logger.error(traceback.format_exc())
             raise HTTPException(status_code=500, detail=f"Error reading journal file: {str(e)}")
 
         if not construction_data:
-            logger.info("No construction data found, returning 'no data'")
+            logger.debug("No construction data found, returning 'no data'")
             return ConstructionResponse(
                 id=None,
                 name='no data',
@@ -59,16 +58,15 @@ async def get_construction(request: Request):
 
         if market_id:
             try:
-                with open(journal_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        data = parse_journal_line(line)
-                        if (data and data.get('event') == 'Docked' and
-                                data.get('MarketID') == market_id):
-                            station_name = data.get('StationName', 'no data')
-                            station_name = station_name.replace('$EXT_PANEL_ColonisationShip;', 'Colonisation Ship : ')
-                            system_name = data.get('StarSystem', 'no data')
-                            logger.info(f"Found station: {station_name} in {system_name}")
-                            break
+                for line in iter_journal_lines(journal_file):
+                    data = parse_journal_line(line)
+                    if (data and data.get('event') == 'Docked' and
+                            data.get('MarketID') == market_id):
+                        station_name = data.get('StationName', 'no data')
+                        station_name = station_name.replace('$EXT_PANEL_ColonisationShip;', 'Colonisation Ship : ')
+                        system_name = data.get('StarSystem', 'no data')
+                        logger.debug("Found station: %s in %s", station_name, system_name)
+                        break
             except Exception as e:
                 logger.error(f"Error finding station name: {e}")
                 # Don't fail the whole request if we can't find the station name
@@ -1,25 +1,47 @@
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import os
+import re
+import json
+import mmap
 import logging
+import threading
+import time
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, List, Callable
 
 from models.export_models import ExportTaskResponse, TaskStatusResponse
-from utils.journal import get_all_journal_files, parse_journal_line
-from utils.file_utils import write_json_file, ensure_directory
+from utils.journal import get_all_journal_files, parse_journal_line, iter_journal_lines, event_tag
+from utils.file_utils import ensure_directory
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/export", tags=["export"])
 
-# Track export tasks
+# Track export tasks. Background workers write under the lock, status reads
+# use a plain dict lookup. Finished tasks are dropped after EXPORT_TASK_TTL
+# seconds, or oldest first once MAX_EXPORT_TASKS is reached.
 export_tasks: Dict[str, Dict[str, Any]] = {}
+export_tasks_lock = threading.Lock()
+EXPORT_TASK_TTL = 3600
+MAX_EXPORT_TASKS = 1024
+
+# Exports are written as JSON lines through a single buffered handle
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Raw line tags used to skip irrelevant journal lines before parsing
+DOCKED_TAG = event_tag('Docked').encode()
+DEPOT_TAG = event_tag('ColonisationConstructionDepot').encode()
+DISEMBARK_TAG = event_tag('Disembark').encode()
+SCAN_ORGANIC_TAG = event_tag('ScanOrganic').encode()
+SELL_ORGANIC_TAG = event_tag('SellOrganicData').encode()
+SELL_ORGANIC_PATTERN = re.compile(rb'^.*' + re.escape(SELL_ORGANIC_TAG) + rb'.*$', re.MULTILINE)
 
 
 @router.post('/construction-history', response_model=ExportTaskResponse)
 async def start_construction_export(request: Request, background_tasks: BackgroundTasks):
     """Start exporting construction history to file."""
-    task_id = str(uuid.uuid4())
-    export_tasks[task_id] = {"status": "running", "progress": "0%"}
+    task_id = create_export_task()
 
     json_location = request.app.state.json_location
     output_dir = request.app.state.config.output_directory
@@ -36,8 +58,7 @@ async def start_construction_export(request: Request, background_tasks: Backgrou
 @router.post('/organic-history', response_model=ExportTaskResponse)
 async def start_organic_export(request: Request, background_tasks: BackgroundTasks):
     """Start exporting organic scan history to file."""
-    task_id = str(uuid.uuid4())
-    export_tasks[task_id] = {"status": "running", "progress": "0%"}
+    task_id = create_export_task()
 
     json_location = request.app.state.json_location
     output_dir = request.app.state.config.output_directory
@@ -54,8 +75,7 @@ async def start_organic_export(request: Request, background_tasks: BackgroundTas
 @router.post('/sell-organic-history', response_model=ExportTaskResponse)
 async def start_sell_organic_export(request: Request, background_tasks: BackgroundTasks):
     """Start exporting organic sales history to file."""
-    task_id = str(uuid.uuid4())
-    export_tasks[task_id] = {"status": "running", "progress": "0%"}
+    task_id = create_export_task()
 
     json_location = request.app.state.json_location
     output_dir = request.app.state.config.output_directory
@@ -72,175 +92,254 @@ async def start_sell_organic_export(request: Request, background_tasks: Backgrou
 @router.get('/status/{task_id}', response_model=TaskStatusResponse)
 async def get_export_status(task_id: str):
     """Check the status of an export task."""
-    if task_id not in export_tasks:
+    task = export_tasks.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    task = export_tasks[task_id]
+    # Progress is stored as counters and only formatted when requested
+    if task["status"] == "completed":
+        progress = "100%"
+    elif task["total"]:
+        progress = f"{int(task['processed'] / task['total'] * 100)}%"
+    else:
+        progress = "0%"
+
     return TaskStatusResponse(
         task_id=task_id,
         status=task["status"],
-        progress=task.get("progress"),
+        progress=progress,
         error=task.get("error")
     )
 
 
-def export_construction_history(task_id: str, json_location: Path, output_dir: Path):
-    """Export construction history to JSON file."""
-    try:
-        ensure_directory(output_dir)
+def create_export_task() -> str:
+    """Register a new running export task, evicting stale finished tasks."""
+    task_id = str(uuid.uuid4())
+    now = time.monotonic()
 
-        output_file = output_dir / "construction_history.json"
-        journal_files = get_all_journal_files(json_location)
+    with export_tasks_lock:
+        finished = [
+            (tid, task["finished_at"]) for tid, task in export_tasks.items()
+            if task["status"] != "running"
+        ]
+        finished.sort(key=lambda item: item[1])
 
-        total_files = len(journal_files)
-        processed = 0
-
-        for filepath in journal_files:
-            try:
-                with open(filepath, 'r') as f:
-                    for line in f:
-                        data = parse_journal_line(line)
-                        if not data or data.get('event') != 'ColonisationConstructionDepot':
-                            continue
-
-                        market_id = data.get('MarketID')
-                        resources = data.get('ResourcesRequired', [])
-                        complete = data.get('ConstructionComplete', False)
-
-                        # Find station name
-                        station_name = 'Unknown'
-                        system_name = 'Unknown'
-
-                        with open(filepath, 'r') as f2:
-                            for line2 in f2:
-                                dock_data = parse_journal_line(line2)
-                                if (dock_data and dock_data.get('event') == 'Docked' and
-                                        dock_data.get('MarketID') == market_id):
-                                    station_name = dock_data.get('StationName', 'Unknown')
-                                    station_name = station_name.replace('$EXT_PANEL_ColonisationShip;',
-                                                                        'Colonisation Ship : ')
-                                    system_name = dock_data.get('StarSystem', 'Unknown')
-                                    break
-
-                        result = {
-                            "id": market_id,
-                            "name": station_name,
-                            "complete": complete,
-                            "system": system_name,
-                            "data": resources
-                        }
-
-                        write_json_file(output_file, result, append=True)
-
-                processed += 1
-                export_tasks[task_id]["progress"] = f"{int(processed / total_files * 100)}%"
-
-            except Exception as e:
-                logger.error(f"Error processing {filepath}: {e}")
-
-        export_tasks[task_id]["status"] = "completed"
-        export_tasks[task_id]["progress"] = "100%"
-        logger.info(f"Construction history export completed: {output_file}")
+        excess = len(export_tasks) - MAX_EXPORT_TASKS + 1
+        for index, (tid, finished_at) in enumerate(finished):
+            if index < excess or now - finished_at > EXPORT_TASK_TTL:
+                del export_tasks[tid]
 
-    except Exception as e:
-        logger.error(f"Error in construction export: {e}")
-        export_tasks[task_id]["status"] = "failed"
-        export_tasks[task_id]["error"] = str(e)
+        export_tasks[task_id] = {"status": "running", "processed": 0, "total": 0}
+
+    return task_id
+
+
+def update_export_task(task_id: str, **fields: Any):
+    """Update fields of an export task, recording when it finishes."""
+    with export_tasks_lock:
+        task = export_tasks.get(task_id)
+        if task is None:
+            return
+
+        task.update(fields)
+        if task["status"] != "running":
+            task["finished_at"] = time.monotonic()
+
+
+def advance_export_task(task_id: str):
+    """Mark one more journal file as processed for an export task."""
+    with export_tasks_lock:
+        task = export_tasks.get(task_id)
+        if task is not None:
+            task["processed"] += 1
+
+
+def export_construction_history(task_id: str, json_location: Path, output_dir: Path):
+    """Export construction history to JSON file."""
+    run_export(task_id, json_location, output_dir / "construction_history.json",
+               collect_construction_records, "construction")
 
 
 def export_organic_history(task_id: str, json_location: Path, output_dir: Path):
     """Export organic scan history to JSON file."""
+    run_export(task_id, json_location, output_dir / "organic_history.json",
+               collect_organic_records, "organic")
+
+
+def export_sell_organic_history(task_id: str, json_location: Path, output_dir: Path):
+    """Export organic sales history to JSON file."""
+    run_export(task_id, json_location, output_dir / "sell_organic_history.json",
+               collect_sell_organic_records, "sell organic")
+
+
+def run_export(
+        task_id: str,
+        json_location: Path,
+        output_file: Path,
+        collect_records: Callable[[Path], List[Dict[str, Any]]],
+        export_name: str
+):
+    """
+    Run an export task, writing the records collected from every journal file.
+
+    Journal files are parsed in parallel worker processes. Results are
+    written in journal order through a single buffered handle.
+
+    Args:
+        task_id: Export task to report progress on
+        json_location: Directory containing journal files
+        output_file: File to write the JSON lines to
+        collect_records: Function returning the records for one journal file
+        export_name: Name of the export used in log messages
+    """
     try:
-        ensure_directory(output_dir)
+        ensure_directory(output_file.parent)
 
-        output_file = output_dir / "organic_history.json"
         journal_files = get_all_journal_files(json_location)
 
-        total_files = len(journal_files)
-        processed = 0
-
-        for filepath in journal_files:
-            try:
-                with open(filepath, 'r') as f:
-                    for line in f:
-                        data = parse_journal_line(line)
-                        if not data or data.get('event') != 'ScanOrganic':
-                            continue
-
-                        system_address = data.get('SystemAddress')
-                        body_id = data.get('Body')
-
-                        # Find system and body name
-                        system_name = ''
-                        body_name = ''
-
-                        with open(filepath, 'r') as f2:
-                            for line2 in f2:
-                                disembark_data = parse_journal_line(line2)
-                                if (disembark_data and disembark_data.get('event') == 'Disembark' and
-                                        disembark_data.get('SystemAddress') == system_address and
-                                        disembark_data.get('BodyID') == body_id):
-                                    system_name = disembark_data.get('StarSystem', '')
-                                    body_name = disembark_data.get('Body', '')
-                                    body_name = body_name.replace(system_name + ' ', '')
-                                    break
-
-                        result = {
-                            "data": data,
-                            "SystemName": system_name,
-                            "Body": body_name
-                        }
-
-                        write_json_file(output_file, result, append=True)
-
-                processed += 1
-                export_tasks[task_id]["progress"] = f"{int(processed / total_files * 100)}%"
-
-            except Exception as e:
-                logger.error(f"Error processing {filepath}: {e}")
-
-        export_tasks[task_id]["status"] = "completed"
-        export_tasks[task_id]["progress"] = "100%"
-        logger.info(f"Organic history export completed: {output_file}")
+        update_export_task(task_id, total=len(journal_files))
+
+        with open(output_file, 'w', buffering=EXPORT_BUFFER_SIZE) as out:
+            if journal_files:
+                max_workers = min(len(journal_files), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for records in executor.map(collect_records, journal_files):
+                        for result in records:
+                            out.write(json.dumps(result) + '\n')
+
+                        advance_export_task(task_id)
+
+        update_export_task(task_id, status="completed")
+        logger.info(f"{export_name.capitalize()} history export completed: {output_file}")
 
     except Exception as e:
-        logger.error(f"Error in organic export: {e}")
-        export_tasks[task_id]["status"] = "failed"
-        export_tasks[task_id]["error"] = str(e)
+        logger.error(f"Error in {export_name} export: {e}")
+        update_export_task(task_id, status="failed", error=str(e))
 
 
-def export_sell_organic_history(task_id: str, json_location: Path, output_dir: Path):
-    """Export organic sales history to JSON file."""
+def collect_construction_records(filepath: Path) -> List[Dict[str, Any]]:
+    """Collect construction depot records from a single journal file."""
+    records = []
+
     try:
-        ensure_directory(output_dir)
+        # Single pass: remember the first dock at each market and
+        # resolve the depot events once the file has been read
+        docks = {}
+        depots = []
+
+        for line in iter_journal_lines(filepath):
+            if DOCKED_TAG not in line and DEPOT_TAG not in line:
+                continue
+
+            data = parse_journal_line(line)
+            if not data:
+                continue
+
+            event = data.get('event')
+            if event == 'Docked':
+                docks.setdefault(data.get('MarketID'), data)
+            elif event == 'ColonisationConstructionDepot':
+                depots.append(data)
+
+        for data in depots:
+            market_id = data.get('MarketID')
+            resources = data.get('ResourcesRequired', [])
+            complete = data.get('ConstructionComplete', False)
+
+            # Find station name
+            station_name = 'Unknown'
+            system_name = 'Unknown'
+
+            dock_data = docks.get(market_id)
+            if dock_data:
+                station_name = dock_data.get('StationName', 'Unknown')
+                station_name = station_name.replace('$EXT_PANEL_ColonisationShip;',
+                                                    'Colonisation Ship : ')
+                system_name = dock_data.get('StarSystem', 'Unknown')
+
+            records.append({
+                "id": market_id,
+                "name": station_name,
+                "complete": complete,
+                "system": system_name,
+                "data": resources
+            })
+
+    except Exception as e:
+        logger.error(f"Error processing {filepath}: {e}")
+
+    return records
 
-        output_file = output_dir / "sell_organic_history.json"
-        journal_files = get_all_journal_files(json_location)
 
-        total_files = len(journal_files)
-        processed = 0
+def collect_organic_records(filepath: Path) -> List[Dict[str, Any]]:
+    """Collect organic scan records from a single journal file."""
+    records = []
 
-        for filepath in journal_files:
-            try:
-                with open(filepath, 'r') as f:
-                    for line in f:
-                        data = parse_journal_line(line)
-                        if data and data.get('event') == 'SellOrganicData':
-                            result = {"data": data}
-                            write_json_file(output_file, result, append=True)
+    try:
+        # Single pass: remember the first disembark on each body and
+        # resolve the scan events once the file has been read
+        disembarks = {}
+        organic_scans = []
+
+        for line in iter_journal_lines(filepath):
+            if DISEMBARK_TAG not in line and SCAN_ORGANIC_TAG not in line:
+                continue
+
+            data = parse_journal_line(line)
+            if not data:
+                continue
+
+            event = data.get('event')
+            if event == 'Disembark':
+                key = (data.get('SystemAddress'), data.get('BodyID'))
+                disembarks.setdefault(key, data)
+            elif event == 'ScanOrganic':
+                organic_scans.append(data)
+
+        for data in organic_scans:
+            system_address = data.get('SystemAddress')
+            body_id = data.get('Body')
+
+            # Find system and body name
+            system_name = ''
+            body_name = ''
+
+            disembark_data = disembarks.get((system_address, body_id))
+            if disembark_data:
+                system_name = disembark_data.get('StarSystem', '')
+                body_name = disembark_data.get('Body', '')
+                body_name = body_name.replace(system_name + ' ', '')
+
+            records.append({
+                "data": data,
+                "SystemName": system_name,
+                "Body": body_name
+            })
+
+    except Exception as e:
+        logger.error(f"Error processing {filepath}: {e}")
 
-                processed += 1
-                export_tasks[task_id]["progress"] = f"{int(processed / total_files * 100)}%"
+    return records
 
-            except Exception as e:
-                logger.error(f"Error processing {filepath}: {e}")
 
-        export_tasks[task_id]["status"] = "completed"
-        export_tasks[task_id]["progress"] = "100%"
-        logger.info(f"Sell organic history export completed: {output_file}")
+def collect_sell_organic_records(filepath: Path) -> List[Dict[str, Any]]:
+    """Collect organic data sales from a single journal file."""
+    records = []
+
+    try:
+        with open(filepath, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return records
+
+            # Let the regex engine find the matching lines in the whole file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in SELL_ORGANIC_PATTERN.finditer(mm):
+                    data = parse_journal_line(match.group(0))
+                    if data and data.get('event') == 'SellOrganicData':
+                        records.append({"data": data})
 
     except Exception as e:
-        logger.error(f"Error in sell organic export: {e}")
-        export_tasks[task_id]["status"] = "failed"
-        export_tasks[task_id]["error"] = str(e)
+        logger.error(f"Error processing {filepath}: {e}")
 
+    return records
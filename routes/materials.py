@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException, Query, Request
-from typing import List, Dict, Optional
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Dict, Optional, Iterator, Tuple
 import logging
+from pydantic import TypeAdapter
 
 from models.materials_models import (
     MaterialsResponse,
@@ -22,6 +24,74 @@ CAPACITY = {
     "encoded": 300
 }
 
+# Validates a whole list of materials in one call
+MATERIAL_LIST_ADAPTER = TypeAdapter(List[MaterialItem])
+
+# Simplified grade detection based on naming patterns
+# In production, use a proper material database
+GRADE_KEYWORDS = {
+    1: ('basic', 'worn', 'compact', 'standard'),
+    2: ('modified', 'flawed', 'irregular', 'salvaged'),
+    3: ('refined', 'anomalous', 'unusual', 'cracked'),
+    4: ('conductive', 'exquisite', 'unexpected', 'classified'),
+    5: ('biotech', 'exceptional', 'proprietary', 'imperial', 'federal')
+}
+
+# Journal key for each material category
+CATEGORY_KEYS = {
+    "raw": "Raw",
+    "manufactured": "Manufactured",
+    "encoded": "Encoded"
+}
+
+
+def iter_categories(materials_event: Dict) -> Iterator[Tuple[str, List[Dict], int]]:
+    """Yield (category, materials, capacity) for each material category."""
+    for category, key in CATEGORY_KEYS.items():
+        yield category, materials_event.get(key, []), CAPACITY[category]
+
+
+# Search index for the most recently seen materials event
+_search_index_event: Optional[Dict] = None
+_search_index: Tuple[Dict[str, Tuple], List[Tuple]] = ({}, [])
+
+
+def get_search_index(materials_event: Dict) -> Tuple[Dict[str, Tuple], List[Tuple]]:
+    """
+    Get the lower-cased search index for a materials event.
+
+    Entries are (name, name_localised, category, material, capacity) tuples.
+    The index is rebuilt only when a different materials event is passed in,
+    which happens when the cached journal lookup picks up a new event.
+
+    Returns:
+        Tuple of exact-name lookup dict and ordered list of entries
+    """
+    global _search_index_event, _search_index
+
+    if materials_event is not _search_index_event:
+        exact_matches = {}
+        entries = []
+
+        for category, materials, max_capacity in iter_categories(materials_event):
+            for material in materials:
+                entry = (
+                    material.get('Name', '').lower(),
+                    material.get('Name_Localised', '').lower(),
+                    category,
+                    material,
+                    max_capacity
+                )
+                entries.append(entry)
+                exact_matches.setdefault(entry[0], entry)
+                if entry[1]:
+                    exact_matches.setdefault(entry[1], entry)
+
+        _search_index = (exact_matches, entries)
+        _search_index_event = materials_event
+
+    return _search_index
+
 
 @router.get(
     '/inventory',
@@ -37,18 +107,13 @@ async def get_materials_inventory(request: Request):
     """
     json_location = request.app.state.json_location
 
-    materials_event = find_latest_event(json_location, 'Materials')
+    materials_event = await run_in_threadpool(find_latest_event, json_location, 'Materials')
 
     if not materials_event:
         raise HTTPException(status_code=404, detail="No materials data found")
 
     try:
-        return MaterialsResponse(
-            Raw=[MaterialItem(**item) for item in materials_event.get('Raw', [])],
-            Manufactured=[MaterialItem(**item) for item in materials_event.get('Manufactured', [])],
-            Encoded=[MaterialItem(**item) for item in materials_event.get('Encoded', [])],
-            timestamp=materials_event.get('timestamp')
-        )
+        return MaterialsResponse.model_validate(materials_event)
     except Exception as e:
         logger.error(f"Error parsing materials data: {e}")
         raise HTTPException(status_code=500, detail=f"Error parsing materials: {str(e)}")
@@ -68,7 +133,7 @@ async def get_materials_summary(request: Request):
     """
     json_location = request.app.state.json_location
 
-    materials_event = find_latest_event(json_location, 'Materials')
+    materials_event = await run_in_threadpool(find_latest_event, json_location, 'Materials')
 
     if not materials_event:
         raise HTTPException(status_code=404, detail="No materials data found")
@@ -82,13 +147,23 @@ async def get_materials_summary(request: Request):
         def calculate_category_stats(materials: List[Dict], max_per_type: int) -> MaterialCategoryStats:
             """Calculate statistics for a material category."""
             total_types = len(materials)
-            total_count = sum(m.get('Count', 0) for m in materials)
+            total_count = 0
+            at_capacity = 0
+            near_capacity = 0
+            near_threshold = max_per_type * 0.9
+
+            # Single pass over the category for all aggregates
+            for m in materials:
+                count = m.get('Count', 0)
+                total_count += count
+                if count >= max_per_type:
+                    at_capacity += 1
+                elif count >= near_threshold:
+                    near_capacity += 1
+
             capacity = total_types * max_per_type
             usage_percent = (total_count / capacity * 100) if capacity > 0 else 0
 
-            at_capacity = sum(1 for m in materials if m.get('Count', 0) >= max_per_type)
-            near_capacity = sum(1 for m in materials if max_per_type * 0.9 <= m.get('Count', 0) < max_per_type)
-
             return MaterialCategoryStats(
                 total_types=total_types,
                 total_count=total_count,
@@ -129,13 +204,13 @@ async def get_raw_materials(request: Request) -> List[MaterialItem]:
     """Get only raw materials inventory."""
     json_location = request.app.state.json_location
 
-    materials_event = find_latest_event(json_location, 'Materials')
+    materials_event = await run_in_threadpool(find_latest_event, json_location, 'Materials')
 
     if not materials_event:
         raise HTTPException(status_code=404, detail="No materials data found")
 
     raw_materials = materials_event.get('Raw', [])
-    return [MaterialItem(**item) for item in raw_materials]
+    return MATERIAL_LIST_ADAPTER.validate_python(raw_materials)
 
 
 @router.get(
@@ -147,13 +222,13 @@ async def get_manufactured_materials(request: Request) -> List[MaterialItem]:
     """Get only manufactured materials inventory."""
     json_location = request.app.state.json_location
 
-    materials_event = find_latest_event(json_location, 'Materials')
+    materials_event = await run_in_threadpool(find_latest_event, json_location, 'Materials')
 
     if not materials_event:
         raise HTTPException(status_code=404, detail="No materials data found")
 
     manufactured_materials = materials_event.get('Manufactured', [])
-    return [MaterialItem(**item) for item in manufactured_materials]
+    return MATERIAL_LIST_ADAPTER.validate_python(manufactured_materials)
 
 
 @router.get(
@@ -165,13 +240,13 @@ async def get_encoded_materials(request: Request) -> List[MaterialItem]:
     """Get only encoded materials inventory."""
     json_location = request.app.state.json_location
 
-    materials_event = find_latest_event(json_location, 'Materials')
+    materials_event = await run_in_threadpool(find_latest_event, json_location, 'Materials')
 
     if not materials_event:
         raise HTTPException(status_code=404, detail="No materials data found")
 
     encoded_materials = materials_event.get('Encoded', [])
-    return [MaterialItem(**item) for item in encoded_materials]
+    return MATERIAL_LIST_ADAPTER.validate_python(encoded_materials)
 
 
 @router.get(
@@ -191,39 +266,37 @@ async def search_material(
     """
     json_location = request.app.state.json_location
 
-    materials_event = find_latest_event(json_location, 'Materials')
+    materials_event = await run_in_threadpool(find_latest_event, json_location, 'Materials')
 
     if not materials_event:
         raise HTTPException(status_code=404, detail="No materials data found")
 
     name_lower = name.lower()
-
-    # Search in all categories
-    categories = {
-        'raw': (materials_event.get('Raw', []), CAPACITY['raw']),
-        'manufactured': (materials_event.get('Manufactured', []), CAPACITY['manufactured']),
-        'encoded': (materials_event.get('Encoded', []), CAPACITY['encoded'])
-    }
-
-    for category, (materials, max_capacity) in categories.items():
-        for material in materials:
-            mat_name = material.get('Name', '').lower()
-            mat_name_loc = material.get('Name_Localised', '').lower()
-
-            if name_lower in mat_name or name_lower in mat_name_loc:
-                count = material.get('Count', 0)
-                at_max = count >= max_capacity
-                percentage = (count / max_capacity * 100) if max_capacity > 0 else 0
-
-                return MaterialSearchResult(
-                    name=material.get('Name'),
-                    name_localised=material.get('Name_Localised'),
-                    category=category,
-                    count=count,
-                    max_capacity=max_capacity,
-                    at_max=at_max,
-                    percentage=round(percentage, 2)
-                )
+    exact_matches, entries = get_search_index(materials_event)
+
+    # Exact name matches first, then substring matches in category order
+    match = exact_matches.get(name_lower)
+    if match is None:
+        for entry in entries:
+            if name_lower in entry[0] or name_lower in entry[1]:
+                match = entry
+                break
+
+    if match is not None:
+        _, _, category, material, max_capacity = match
+        count = material.get('Count', 0)
+        at_max = count >= max_capacity
+        percentage = (count / max_capacity * 100) if max_capacity > 0 else 0
+
+        return MaterialSearchResult(
+            name=material.get('Name'),
+            name_localised=material.get('Name_Localised'),
+            category=category,
+            count=count,
+            max_capacity=max_capacity,
+            at_max=at_max,
+            percentage=round(percentage, 2)
+        )
 
     raise HTTPException(status_code=404, detail=f"Material '{name}' not found in inventory")
 
@@ -241,31 +314,18 @@ async def get_materials_at_capacity(request: Request) -> Dict[str, List[Material
     """
     json_location = request.app.state.json_location
 
-    materials_event = find_latest_event(json_location, 'Materials')
+    materials_event = await run_in_threadpool(find_latest_event, json_location, 'Materials')
 
     if not materials_event:
         raise HTTPException(status_code=404, detail="No materials data found")
 
-    result = {
-        'raw': [],
-        'manufactured': [],
-        'encoded': []
-    }
-
-    # Check raw materials
-    for material in materials_event.get('Raw', []):
-        if material.get('Count', 0) >= CAPACITY['raw']:
-            result['raw'].append(MaterialItem(**material))
-
-    # Check manufactured materials
-    for material in materials_event.get('Manufactured', []):
-        if material.get('Count', 0) >= CAPACITY['manufactured']:
-            result['manufactured'].append(MaterialItem(**material))
+    result = {}
 
-    # Check encoded materials
-    for material in materials_event.get('Encoded', []):
-        if material.get('Count', 0) >= CAPACITY['encoded']:
-            result['encoded'].append(MaterialItem(**material))
+    for category, materials, max_capacity in iter_categories(materials_event):
+        result[category] = MATERIAL_LIST_ADAPTER.validate_python([
+            material for material in materials
+            if material.get('Count', 0) >= max_capacity
+        ])
 
     return result
 
@@ -286,29 +346,18 @@ async def get_low_stock_materials(
     """
     json_location = request.app.state.json_location
 
-    materials_event = find_latest_event(json_location, 'Materials')
+    materials_event = await run_in_threadpool(find_latest_event, json_location, 'Materials')
 
     if not materials_event:
         raise HTTPException(status_code=404, detail="No materials data found")
 
-    result = {
-        'raw': [],
-        'manufactured': [],
-        'encoded': []
-    }
-
-    # Check each category
-    for material in materials_event.get('Raw', []):
-        if material.get('Count', 0) < threshold:
-            result['raw'].append(MaterialItem(**material))
-
-    for material in materials_event.get('Manufactured', []):
-        if material.get('Count', 0) < threshold:
-            result['manufactured'].append(MaterialItem(**material))
+    result = {}
 
-    for material in materials_event.get('Encoded', []):
-        if material.get('Count', 0) < threshold:
-            result['encoded'].append(MaterialItem(**material))
+    for category, materials, _ in iter_categories(materials_event):
+        result[category] = MATERIAL_LIST_ADAPTER.validate_python([
+            material for material in materials
+            if material.get('Count', 0) < threshold
+        ])
 
     return result
 
@@ -330,42 +379,27 @@ async def get_materials_by_grade(
     """
     json_location = request.app.state.json_location
 
-    materials_event = find_latest_event(json_location, 'Materials')
+    materials_event = await run_in_threadpool(find_latest_event, json_location, 'Materials')
 
     if not materials_event:
         raise HTTPException(status_code=404, detail="No materials data found")
 
-    # Simplified grade detection based on naming patterns
-    # In production, use a proper material database
-    grade_keywords = {
-        1: ['basic', 'worn', 'compact', 'standard'],
-        2: ['modified', 'flawed', 'irregular', 'salvaged'],
-        3: ['refined', 'anomalous', 'unusual', 'cracked'],
-        4: ['conductive', 'exquisite', 'unexpected', 'classified'],
-        5: ['biotech', 'exceptional', 'proprietary', 'imperial', 'federal']
-    }
-
-    keywords = grade_keywords.get(grade, [])
+    keywords = GRADE_KEYWORDS.get(grade, ())
+    _, entries = get_search_index(materials_event)
 
-    result = {
-        'raw': [],
+    # Raw materials don't have grades in the traditional sense
+    matches = {
+        'raw': materials_event.get('Raw', []),
         'manufactured': [],
         'encoded': []
     }
 
-    for material in materials_event.get('Raw', []):
-        name = material.get('Name', '').lower()
-        # Raw materials don't have grades in the traditional sense
-        result['raw'].append(MaterialItem(**material))
-
-    for material in materials_event.get('Manufactured', []):
-        name_loc = material.get('Name_Localised', '').lower()
-        if any(keyword in name_loc for keyword in keywords):
-            result['manufactured'].append(MaterialItem(**material))
-
-    for material in materials_event.get('Encoded', []):
-        name_loc = material.get('Name_Localised', '').lower()
-        if any(keyword in name_loc for keyword in keywords):
-            result['encoded'].append(MaterialItem(**material))
+    # Match against the lower-cased localised names from the search index
+    for _, name_loc, category, material, _ in entries:
+        if category != 'raw' and any(keyword in name_loc for keyword in keywords):
+            matches[category].append(material)
 
-    return result
\ No newline at end of file
+    return {
+        category: MATERIAL_LIST_ADAPTER.validate_python(materials)
+        for category, materials in matches.items()
+    }
\ No newline at end of file
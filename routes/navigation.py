@@ -1,53 +1,38 @@
 from fastapi import APIRouter, HTTPException, Request, Query
-from typing import Dict, Any
+from fastapi.concurrency import run_in_threadpool
+from pathlib import Path
+from typing import Dict, Any, List
 import logging
 
 from models.navigation_models import LocationResponse, NavRouteResponse
 from utils.file_utils import read_json_file
 import lang.descriptions_en as desc
-from utils.journal import get_latest_journal_file, parse_journal_line
+from utils.journal import get_latest_journal_file, parse_journal_line, iter_lines_reverse, event_tag, SYSTEM_EVENTS
+from utils.app_state import get_json_file
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/navigation", tags=["navigation"])
 
+# Star classes that can be fuel scooped
+SCOOPABLE_STARS = frozenset({'A', 'B', 'F', 'G', 'K', 'M', 'O'})
+
+# Raw line tags used to skip irrelevant journal lines before parsing
+LOCATION_TAGS = tuple(event_tag(event).encode() for event in sorted(SYSTEM_EVENTS))
+FSD_JUMP_TAG = event_tag('FSDJump').encode()
+START_JUMP_TAG = event_tag('StartJump').encode()
+
 
 @router.get('/current-location', response_model=LocationResponse)
 async def get_current_location(request: Request):
     """Get current system and location."""
     json_location = request.app.state.json_location
-    journal_file = get_latest_journal_file(json_location)
+    journal_file = await run_in_threadpool(get_latest_journal_file, json_location)
 
     if not journal_file:
         raise HTTPException(status_code=404, detail="No journal file found")
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in reversed(list(f)):
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                # Look for location events
-                if data.get('event') in ('Location', 'FSDJump', 'CarrierJump'):
-                    return LocationResponse(
-                        StarSystem=data.get('StarSystem', 'Unknown'),
-                        SystemAddress=data.get('SystemAddress'),
-                        StarPos=data.get('StarPos', []),
-                        Body=data.get('Body'),
-                        BodyType=data.get('BodyType'),
-                        Docked=data.get('Docked', False),
-                        StationName=data.get('StationName')
-                    )
-
-        return LocationResponse(
-            StarSystem='Unknown',
-            SystemAddress=None,
-            StarPos=[],
-            Body=None,
-            BodyType=None,
-            Docked=False,
-            StationName=None
-        )
+        return await run_in_threadpool(_read_location, journal_file)
 
     except Exception as e:
         logger.error(f"Error getting location: {e}")
@@ -61,37 +46,19 @@ async def get_jump_history(
 ) -> list[Dict[str, Any]]:
     """Get recent jump history."""
     json_location = request.app.state.json_location
-    journal_file = get_latest_journal_file(json_location)
+    journal_file = await run_in_threadpool(get_latest_journal_file, json_location)
 
     if not journal_file:
         raise HTTPException(status_code=404, detail="No journal file found")
 
-    jumps = []
-
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in reversed(list(f)):
-                if len(jumps) >= limit:
-                    break
-
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                if data.get('event') == 'FSDJump':
-                    jumps.append({
-                        'system': data.get('StarSystem'),
-                        'timestamp': data.get('timestamp'),
-                        'jump_dist': data.get('JumpDist'),
-                        'fuel_used': data.get('FuelUsed')
-                    })
-
-        return jumps
+        return await run_in_threadpool(_read_jump_history, journal_file, limit)
 
     except Exception as e:
         logger.error(f"Error getting jump history: {e}")
         raise HTTPException(status_code=500, detail="Error reading journal file")
 
+
 @router.get('/start-jump')
 async def get_start_jump(
         request: Request,
@@ -99,47 +66,25 @@ async def get_start_jump(
 ) -> list[Dict[str, Any]]:
     """Get currently requested jump."""
     json_location = request.app.state.json_location
-    journal_file = get_latest_journal_file(json_location)
+    journal_file = await run_in_threadpool(get_latest_journal_file, json_location)
 
     if not journal_file:
         raise HTTPException(status_code=404, detail="No journal file found")
 
-    jumps = []
-
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in reversed(list(f)):
-                if len(jumps) >= limit:
-                    break
-
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                if data.get('event') == 'StartJump' and not data.get('JumpType') == 'Supercruise':
-                    scoopable = fuel_stars(data.get('StarClass'))
-                    jumps.append({
-                        'jump-type': data.get('JumpType'),
-                        'system': data.get('StarSystem'),
-                        'address': data.get('SystemAddress'),
-                        'timestamp': data.get('timestamp'),
-                        'star_type': data.get('StarClass'),
-                        'fuel_star': scoopable
-                    })
-
-        return jumps
+        return await run_in_threadpool(_read_start_jumps, journal_file, limit)
 
     except Exception as e:
         logger.error(f"Error getting jump history: {e}")
         raise HTTPException(status_code=500, detail="Error reading journal file")
 
+
 @router.get('/nav-route', response_model=NavRouteResponse, description=desc.NAVIGATION_ROUTE)
 async def get_nav_route(request: Request):
     """Get nav route."""
-    json_location = request.app.state.json_location
-    navroute_file = json_location / 'NavRoute.json'
+    navroute_file = get_json_file(request, 'NavRoute.json')
 
-    route_data = read_json_file(navroute_file)
+    route_data = await run_in_threadpool(read_json_file, navroute_file)
     if not route_data:
         raise HTTPException(status_code=404, detail="Cannot read navroute file")
 
@@ -149,13 +94,13 @@ async def get_nav_route(request: Request):
         route= route_data.get('Route', [])
     )
 
+
 @router.get('/nearest-station')
 async def get_nearest_station(request: Request):
     """Get information about the nearest station."""
-    json_location = request.app.state.json_location
-    status_file = json_location / 'Status.json'
+    status_file = get_json_file(request, 'Status.json')
 
-    data = read_json_file(status_file)
+    data = await run_in_threadpool(read_json_file, status_file)
     if not data:
         raise HTTPException(status_code=503, detail="Cannot read status file")
 
@@ -165,12 +110,95 @@ async def get_nearest_station(request: Request):
         "docked": data.get('Docked', False)
     }
 
-def fuel_stars(check_star):
-    """Return a list of scoopable fuels stars."""
-    scoopable = {'A', 'B', 'F', 'G', 'K', 'M', 'O' }
-    if check_star in scoopable:
-        return True
-    else:
-        return False
+
+def _read_location(journal_file: Path) -> LocationResponse:
+    """Find the latest location event in a journal file."""
+    for line in iter_lines_reverse(journal_file):
+        if not any(tag in line for tag in LOCATION_TAGS):
+            continue
+
+        data = parse_journal_line(line)
+        if not data:
+            continue
+
+        # Look for location events
+        if data.get('event') in SYSTEM_EVENTS:
+            return LocationResponse(
+                StarSystem=data.get('StarSystem', 'Unknown'),
+                SystemAddress=data.get('SystemAddress'),
+                StarPos=data.get('StarPos', []),
+                Body=data.get('Body'),
+                BodyType=data.get('BodyType'),
+                Docked=data.get('Docked', False),
+                StationName=data.get('StationName')
+            )
+
+    return LocationResponse(
+        StarSystem='Unknown',
+        SystemAddress=None,
+        StarPos=[],
+        Body=None,
+        BodyType=None,
+        Docked=False,
+        StationName=None
+    )
 
 
+def _read_jump_history(journal_file: Path, limit: int) -> List[Dict[str, Any]]:
+    """Collect the most recent FSD jumps from a journal file."""
+    jumps = []
+
+    for line in iter_lines_reverse(journal_file):
+        if len(jumps) >= limit:
+            break
+
+        if FSD_JUMP_TAG not in line:
+            continue
+
+        data = parse_journal_line(line)
+        if not data:
+            continue
+
+        if data.get('event') == 'FSDJump':
+            jumps.append({
+                'system': data.get('StarSystem'),
+                'timestamp': data.get('timestamp'),
+                'jump_dist': data.get('JumpDist'),
+                'fuel_used': data.get('FuelUsed')
+            })
+
+    return jumps
+
+
+def _read_start_jumps(journal_file: Path, limit: int) -> List[Dict[str, Any]]:
+    """Collect the most recent hyperspace jump requests from a journal file."""
+    jumps = []
+
+    for line in iter_lines_reverse(journal_file):
+        if len(jumps) >= limit:
+            break
+
+        if START_JUMP_TAG not in line:
+            continue
+
+        data = parse_journal_line(line)
+        if not data:
+            continue
+
+        if data.get('event') == 'StartJump' and not data.get('JumpType') == 'Supercruise':
+            scoopable = fuel_stars(data.get('StarClass'))
+            jumps.append({
+                'jump-type': data.get('JumpType'),
+                'system': data.get('StarSystem'),
+                'address': data.get('SystemAddress'),
+                'timestamp': data.get('timestamp'),
+                'star_type': data.get('StarClass'),
+                'fuel_star': scoopable
+            })
+
+    return jumps
+
+
+def fuel_stars(check_star):
+    """Return whether a star class is scoopable for fuel."""
+    return check_star in SCOOPABLE_STARS
@@ -1,26 +1,45 @@
 from fastapi import APIRouter, HTTPException, Query, Request
-from typing import List, Dict, Optional, Any
-from collections import defaultdict, Counter
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Iterator
+from collections import defaultdict
 import logging
+import orjson
 
 from models.organics_models import (
     OrganicScan,
+    OrganicScanRow,
     OrganicSummary,
     OrganicStats,
     SystemOrganics,
     GenusDistribution
 )
-from utils.journal import (
-    get_latest_journal_file,
-    get_all_journal_files,
-    parse_journal_line
-)
+from utils.journal import get_latest_journal_file, get_journal_files, SYSTEM_EVENTS
+from utils.organic_aggregator import organics_cache, aggregate_organics
 import lang.descriptions_en as desc
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/organics", tags=["organics"])
 
 
+def find_last_system_event(events: List[Dict[str, Any]]) -> Optional[int]:
+    """
+    Find the index of the most recent system change in a list of events.
+
+    Args:
+        events: Journal events in file order
+
+    Returns:
+        Index of the last FSDJump, Location or CarrierJump event, or None
+    """
+    for index in range(len(events) - 1, -1, -1):
+        if events[index].get('event') in SYSTEM_EVENTS:
+            return index
+
+    return None
+
+
 @router.get(
     '/current-system',
     response_model=SystemOrganics,
@@ -34,87 +53,16 @@ async def get_current_system_organics(request: Request):
     Returns both Analyse (first contact) and Log (sample collection) events.
     """
     json_location = request.app.state.json_location
-    journal_file = get_latest_journal_file(json_location)
+    journal_file = await run_in_threadpool(get_latest_journal_file, json_location)
 
     if not journal_file:
         raise HTTPException(status_code=404, detail="No journal file found")
 
-    current_system = None
-    system_address = None
-    current_body = None
-    current_body_id = None
-    scans = []
-
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                event = data.get('event')
-
-                # Track system changes
-                if event in ('FSDJump', 'Location', 'CarrierJump'):
-                    current_system = data.get('StarSystem')
-                    system_address = data.get('SystemAddress')
-                    current_body = data.get('Body')
-                    current_body_id = data.get('BodyID')
-                    scans = []  # Reset scans for new system
-
-                # Track body changes (landing/disembarking)
-                elif event == 'Disembark' and data.get('SystemAddress') == system_address:
-                    current_body = data.get('Body')
-                    current_body_id = data.get('BodyID')
-
-                # Track organic scans
-                elif event == 'ScanOrganic' and data.get('SystemAddress') == system_address:
-                    scan = OrganicScan(
-                        timestamp=data.get('timestamp'),
-                        scan_type=data.get('ScanType'),
-                        genus=data.get('Genus_Localised', data.get('Genus', '')),
-                        species=data.get('Species_Localised', data.get('Species', '')),
-                        variant=data.get('Variant_Localised', data.get('Variant', '')),
-                        system_name=current_system,
-                        system_address=system_address,
-                        body_name=current_body,
-                        body_id=current_body_id or data.get('Body'),
-                        was_logged=data.get('WasLogged', False)
-                    )
-                    scans.append(scan)
-
-        if not current_system:
-            raise HTTPException(status_code=404, detail="No current system found")
-
-        # Group by body
-        bodies = defaultdict(lambda: {'analyse': [], 'log': []})
-        for scan in scans:
-            if scan.scan_type == 'Analyse':
-                bodies[scan.body_name]['analyse'].append(scan)
-            elif scan.scan_type == 'Log':
-                bodies[scan.body_name]['log'].append(scan)
-
-        # Calculate stats
-        total_analyse = sum(1 for s in scans if s.scan_type == 'Analyse')
-        total_log = sum(1 for s in scans if s.scan_type == 'Log')
-        unique_species = len(set(s.species for s in scans if s.species))
-        unique_genus = len(set(s.genus for s in scans if s.genus))
-
-        # Count first discoveries (not previously logged)
-        first_discoveries = sum(1 for s in scans if s.scan_type == 'Analyse' and not s.was_logged)
-
-        return SystemOrganics(
-            system_name=current_system,
-            system_address=system_address,
-            total_analyse_scans=total_analyse,
-            total_log_scans=total_log,
-            unique_species=unique_species,
-            unique_genus=unique_genus,
-            first_discoveries=first_discoveries,
-            bodies=dict(bodies),
-            all_scans=scans
-        )
+        return await run_in_threadpool(_collect_current_system, journal_file)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting organic scans: {e}")
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -137,68 +85,16 @@ async def get_all_organic_scans(
     Can filter by scan type and optionally scan all historical journals.
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    scans = []
-    current_system = None
-    system_address = None
-    current_body = None
-    current_body_id = None
-
-    try:
-        for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    event = data.get('event')
-
-                    if event in ('FSDJump', 'Location', 'CarrierJump'):
-                        current_system = data.get('StarSystem')
-                        system_address = data.get('SystemAddress')
-                        current_body = data.get('Body')
-                        current_body_id = data.get('BodyID')
-
-                    elif event == 'Disembark':
-                        current_body = data.get('Body')
-                        current_body_id = data.get('BodyID')
-
-                    elif event == 'ScanOrganic':
-                        scan_type_val = data.get('ScanType')
-
-                        # Filter by scan type if specified
-                        if scan_type and scan_type_val != scan_type:
-                            continue
-
-                        scan = OrganicScan(
-                            timestamp=data.get('timestamp'),
-                            scan_type=scan_type_val,
-                            genus=data.get('Genus_Localised', data.get('Genus', '')),
-                            species=data.get('Species_Localised', data.get('Species', '')),
-                            variant=data.get('Variant_Localised', data.get('Variant', '')),
-                            system_name=current_system,
-                            system_address=system_address,
-                            body_name=current_body,
-                            body_id=current_body_id or data.get('Body'),
-                            was_logged=data.get('WasLogged', False)
-                        )
-                        scans.append(scan)
-
-        return scans
-
-    except Exception as e:
-        logger.error(f"Error getting organic scans: {e}")
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+    # Scans are written out as they are found instead of being collected first
+    return StreamingResponse(
+        _stream_all_scans(journal_files, scan_type),
+        media_type="application/json"
+    )
 
 
 @router.get(
@@ -217,90 +113,27 @@ async def get_organic_statistics(
     Includes counts by genus, species, and discovery status.
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    total_analyse = 0
-    total_log = 0
-    first_discoveries = 0
-    genus_counter = Counter()
-    species_counter = Counter()
-    variant_counter = Counter()
-    systems_with_organics = set()
-    bodies_with_organics = set()
-
-    current_system = None
-    system_address = None
-    current_body = None
-
     try:
-        for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    event = data.get('event')
-
-                    if event in ('FSDJump', 'Location', 'CarrierJump'):
-                        current_system = data.get('StarSystem')
-                        system_address = data.get('SystemAddress')
-                        current_body = data.get('Body')
-
-                    elif event == 'Disembark':
-                        current_body = data.get('Body')
-
-                    elif event == 'ScanOrganic':
-                        scan_type = data.get('ScanType')
-
-                        if scan_type == 'Analyse':
-                            total_analyse += 1
-                            if not data.get('WasLogged', False):
-                                first_discoveries += 1
-                        elif scan_type == 'Log':
-                            total_log += 1
-
-                        genus = data.get('Genus_Localised', data.get('Genus', ''))
-                        species = data.get('Species_Localised', data.get('Species', ''))
-                        variant = data.get('Variant_Localised', data.get('Variant', ''))
-
-                        if genus:
-                            genus_counter[genus] += 1
-                        if species:
-                            species_counter[species] += 1
-                        if variant:
-                            variant_counter[variant] += 1
-
-                        if current_system:
-                            systems_with_organics.add(current_system)
-                        if current_body:
-                            bodies_with_organics.add(f"{current_system}:{current_body}")
-
-        # Get most common
-        most_common_genus = genus_counter.most_common(1)[0][0] if genus_counter else "None"
-        most_common_species = species_counter.most_common(1)[0][0] if species_counter else "None"
+        aggregate = await run_in_threadpool(aggregate_organics, journal_files)
 
         return OrganicStats(
-            total_analyse_scans=total_analyse,
-            total_log_scans=total_log,
-            first_discoveries=first_discoveries,
-            unique_genus=len(genus_counter),
-            unique_species=len(species_counter),
-            unique_variants=len(variant_counter),
-            systems_with_organics=len(systems_with_organics),
-            bodies_with_organics=len(bodies_with_organics),
-            most_common_genus=most_common_genus,
-            most_common_species=most_common_species,
-            genus_distribution=dict(genus_counter.most_common()),
-            species_distribution=dict(species_counter.most_common())
+            total_analyse_scans=aggregate.total_analyse,
+            total_log_scans=aggregate.total_log,
+            first_discoveries=aggregate.first_discovery_count,
+            unique_genus=len(aggregate.genus_counter),
+            unique_species=len(aggregate.species_counter),
+            unique_variants=len(aggregate.variant_counter),
+            systems_with_organics=len(aggregate.systems_with_organics),
+            bodies_with_organics=len(aggregate.bodies_with_organics),
+            most_common_genus=aggregate.most_common_genus,
+            most_common_species=aggregate.most_common_species,
+            genus_distribution=aggregate.genus_distribution,
+            species_distribution=aggregate.species_distribution
         )
 
     except Exception as e:
@@ -324,58 +157,23 @@ async def get_genus_distribution(
     Shows count and associated species for each genus.
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    genus_data = defaultdict(lambda: {
-        'count': 0,
-        'species': set(),
-        'first_discoveries': 0
-    })
-
-    current_system = None
-
     try:
-        for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    event = data.get('event')
-
-                    if event in ('FSDJump', 'Location', 'CarrierJump'):
-                        current_system = data.get('StarSystem')
-
-                    elif event == 'ScanOrganic':
-                        genus = data.get('Genus_Localised', data.get('Genus', ''))
-                        species = data.get('Species_Localised', data.get('Species', ''))
-
-                        if genus:
-                            genus_data[genus]['count'] += 1
-                            if species:
-                                genus_data[genus]['species'].add(species)
-
-                            if data.get('ScanType') == 'Analyse' and not data.get('WasLogged', False):
-                                genus_data[genus]['first_discoveries'] += 1
+        aggregate = await run_in_threadpool(aggregate_organics, journal_files)
 
         # Convert to list of GenusDistribution objects
         result = []
-        for genus, data in genus_data.items():
+        for genus, species in aggregate.species_by_genus.items():
             result.append(GenusDistribution(
                 genus=genus,
-                total_scans=data['count'],
-                unique_species=len(data['species']),
-                species_list=sorted(list(data['species'])),
-                first_discoveries=data['first_discoveries']
+                total_scans=aggregate.genus_counter[genus],
+                unique_species=len(species),
+                species_list=sorted(species),
+                first_discoveries=aggregate.first_discoveries_by_genus[genus]
             ))
 
         # Sort by total scans (most common first)
@@ -404,60 +202,14 @@ async def get_first_organic_discoveries(
     Returns only Analyse scans where WasLogged was false.
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    first_discoveries = []
-    current_system = None
-    system_address = None
-    current_body = None
-    current_body_id = None
-
     try:
-        for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    event = data.get('event')
-
-                    if event in ('FSDJump', 'Location', 'CarrierJump'):
-                        current_system = data.get('StarSystem')
-                        system_address = data.get('SystemAddress')
-                        current_body = data.get('Body')
-                        current_body_id = data.get('BodyID')
-
-                    elif event == 'Disembark':
-                        current_body = data.get('Body')
-                        current_body_id = data.get('BodyID')
-
-                    elif event == 'ScanOrganic':
-                        # Only include Analyse scans that were not previously logged
-                        if data.get('ScanType') == 'Analyse' and not data.get('WasLogged', False):
-                            scan = OrganicScan(
-                                timestamp=data.get('timestamp'),
-                                scan_type=data.get('ScanType'),
-                                genus=data.get('Genus_Localised', data.get('Genus', '')),
-                                species=data.get('Species_Localised', data.get('Species', '')),
-                                variant=data.get('Variant_Localised', data.get('Variant', '')),
-                                system_name=current_system,
-                                system_address=system_address,
-                                body_name=current_body,
-                                body_id=current_body_id or data.get('Body'),
-                                was_logged=False
-                            )
-                            first_discoveries.append(scan)
-
-        return first_discoveries
+        aggregate = await run_in_threadpool(aggregate_organics, journal_files)
+        return aggregate.first_discoveries
 
     except Exception as e:
         logger.error(f"Error getting first discoveries: {e}")
@@ -479,91 +231,158 @@ async def get_organics_by_system(
     Returns a dictionary with system names as keys.
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    systems = defaultdict(lambda: {
-        'system_name': '',
-        'system_address': None,
-        'scans': [],
-        'unique_species': set(),
-        'unique_genus': set(),
-        'first_discoveries': 0
-    })
+    try:
+        aggregate = await run_in_threadpool(aggregate_organics, journal_files)
+        return aggregate.by_system
+
+    except Exception as e:
+        logger.error(f"Error getting organics by system: {e}")
+        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+
 
+def _collect_current_system(journal_file: Path) -> SystemOrganics:
+    """Build the organic scans and aggregates for the current system."""
+    # Scans and their aggregates for the current system
+    scans = []
+    bodies = defaultdict(lambda: {'analyse': [], 'log': []})
+    species_seen = set()
+    genus_seen = set()
+    total_analyse = 0
+    total_log = 0
+    first_discoveries = 0
+
+    events = organics_cache.load(journal_file)
+
+    # Only the events since the last system change matter, so find it
+    # from the end and read forward from there
+    start = find_last_system_event(events)
+    if start is None:
+        raise HTTPException(status_code=404, detail="No current system found")
+
+    system_event = events[start]
+    current_system = system_event.get('StarSystem')
+    system_address = system_event.get('SystemAddress')
+    current_body = system_event.get('Body')
+    current_body_id = system_event.get('BodyID')
+
+    for index in range(start + 1, len(events)):
+        data = events[index]
+        get = data.get
+        event = get('event')
+
+        # Track body changes (landing/disembarking)
+        if event == 'Disembark' and get('SystemAddress') == system_address:
+            current_body = get('Body')
+            current_body_id = get('BodyID')
+
+        # Track organic scans
+        elif event == 'ScanOrganic' and get('SystemAddress') == system_address:
+            scan = OrganicScan(
+                timestamp=get('timestamp'),
+                scan_type=get('ScanType'),
+                genus=get('Genus_Localised') or get('Genus', ''),
+                species=get('Species_Localised') or get('Species', ''),
+                variant=get('Variant_Localised') or get('Variant', ''),
+                system_name=current_system,
+                system_address=system_address,
+                body_name=current_body,
+                body_id=current_body_id or get('Body'),
+                was_logged=get('WasLogged', False)
+            )
+            scans.append(scan)
+
+            # Group by body and count scan types
+            if scan.scan_type == 'Analyse':
+                bodies[scan.body_name]['analyse'].append(scan)
+                total_analyse += 1
+                # Count first discoveries (not previously logged)
+                if not scan.was_logged:
+                    first_discoveries += 1
+            elif scan.scan_type == 'Log':
+                bodies[scan.body_name]['log'].append(scan)
+                total_log += 1
+
+            if scan.species:
+                species_seen.add(scan.species)
+            if scan.genus:
+                genus_seen.add(scan.genus)
+
+    if not current_system:
+        raise HTTPException(status_code=404, detail="No current system found")
+
+    return SystemOrganics(
+        system_name=current_system,
+        system_address=system_address,
+        total_analyse_scans=total_analyse,
+        total_log_scans=total_log,
+        unique_species=len(species_seen),
+        unique_genus=len(genus_seen),
+        first_discoveries=first_discoveries,
+        bodies=dict(bodies),
+        all_scans=scans
+    )
+
+
+def _stream_all_scans(journal_files: List[Path], scan_type: Optional[str]) -> Iterator[bytes]:
+    """Encode the organic scans in the journal files as a JSON array, piece by piece."""
+    try:
+        separator = b'['
+        for scan in _iter_all_scans(journal_files, scan_type):
+            yield separator + orjson.dumps(scan)
+            separator = b','
+
+        yield b']' if separator == b',' else b'[]'
+
+    except Exception as e:
+        # The response has already started, so the error can only be logged
+        logger.error(f"Error getting organic scans: {e}")
+        raise
+
+
+def _iter_all_scans(journal_files: List[Path], scan_type: Optional[str]) -> Iterator[OrganicScanRow]:
+    """Iterate over every organic scan in the journal files, optionally of one scan type."""
     current_system = None
     system_address = None
     current_body = None
     current_body_id = None
 
-    try:
-        for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    event = data.get('event')
-
-                    if event in ('FSDJump', 'Location', 'CarrierJump'):
-                        current_system = data.get('StarSystem')
-                        system_address = data.get('SystemAddress')
-                        current_body = data.get('Body')
-                        current_body_id = data.get('BodyID')
-
-                    elif event == 'Disembark':
-                        current_body = data.get('Body')
-                        current_body_id = data.get('BodyID')
-
-                    elif event == 'ScanOrganic' and current_system:
-                        genus = data.get('Genus_Localised', data.get('Genus', ''))
-                        species = data.get('Species_Localised', data.get('Species', ''))
-
-                        scan = {
-                            'timestamp': data.get('timestamp'),
-                            'scan_type': data.get('ScanType'),
-                            'genus': genus,
-                            'species': species,
-                            'variant': data.get('Variant_Localised', data.get('Variant', '')),
-                            'body_name': current_body,
-                            'was_logged': data.get('WasLogged', False)
-                        }
-
-                        systems[current_system]['system_name'] = current_system
-                        systems[current_system]['system_address'] = system_address
-                        systems[current_system]['scans'].append(scan)
-
-                        if genus:
-                            systems[current_system]['unique_genus'].add(genus)
-                        if species:
-                            systems[current_system]['unique_species'].add(species)
-
-                        if data.get('ScanType') == 'Analyse' and not data.get('WasLogged', False):
-                            systems[current_system]['first_discoveries'] += 1
-
-        # Convert sets to counts and format result
-        result = {}
-        for system_name, system_data in systems.items():
-            result[system_name] = {
-                'system_name': system_data['system_name'],
-                'system_address': system_data['system_address'],
-                'total_scans': len(system_data['scans']),
-                'unique_genus': len(system_data['unique_genus']),
-                'unique_species': len(system_data['unique_species']),
-                'first_discoveries': system_data['first_discoveries'],
-                'scans': system_data['scans']
-            }
-
-        return result
+    for data in organics_cache.load_all(journal_files):
+        get = data.get
+        event = get('event')
+
+        if event in SYSTEM_EVENTS:
+            current_system = get('StarSystem')
+            system_address = get('SystemAddress')
+            current_body = get('Body')
+            current_body_id = get('BodyID')
+
+        elif event == 'Disembark':
+            current_body = get('Body')
+            current_body_id = get('BodyID')
+
+        elif event == 'ScanOrganic':
+            scan_type_val = get('ScanType')
+
+            # Filter by scan type if specified
+            if scan_type and scan_type_val != scan_type:
+                continue
+
+            scan = OrganicScanRow(
+                timestamp=get('timestamp'),
+                scan_type=scan_type_val,
+                genus=get('Genus_Localised') or get('Genus', ''),
+                species=get('Species_Localised') or get('Species', ''),
+                variant=get('Variant_Localised') or get('Variant', ''),
+                system_name=current_system,
+                system_address=system_address,
+                body_name=current_body,
+                body_id=current_body_id or get('Body'),
+                was_logged=get('WasLogged', False)
+            )
+            yield scan
 
-    except Exception as e:
-        logger.error(f"Error getting organics by system: {e}")
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
\ No newline at end of file
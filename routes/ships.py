@@ -1,9 +1,12 @@
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 import logging
 
 from models.ship_models import ShipResponse, LoadoutResponse, ShipModulesResponse
-from utils.file_utils import read_json_file
+from utils.file_utils import read_json_file_with_etag
+from utils.etag import check_etag
 from utils.journal import find_latest_event
+from utils.app_state import get_json_file
 import lang.descriptions_en as desc
 
 logger = logging.getLogger(__name__)
@@ -15,7 +18,7 @@ async def get_current_ship(request: Request):
     """Get information about the current ship."""
     json_location = request.app.state.json_location
 
-    loadout_event = find_latest_event(json_location, 'Loadout')
+    loadout_event = await run_in_threadpool(find_latest_event, json_location, 'Loadout')
 
     if not loadout_event:
         raise HTTPException(status_code=404, detail="No ship loadout found")
@@ -35,7 +38,7 @@ async def get_loadout(request: Request):
     """Get complete ship loadout with modules."""
     json_location = request.app.state.json_location
 
-    loadout_event = find_latest_event(json_location, 'Loadout')
+    loadout_event = await run_in_threadpool(find_latest_event, json_location, 'Loadout')
 
     if not loadout_event:
         raise HTTPException(status_code=404, detail="No ship loadout found")
@@ -48,15 +51,16 @@ async def get_loadout(request: Request):
     )
 
 @router.get('/ship-modules', response_model=ShipModulesResponse, description=desc.SHIP_MODULES)
-async def get_ship_modules(request: Request):
+async def get_ship_modules(request: Request, response: Response):
     """Get list of installed ship modules."""
-    json_location = request.app.state.json_location
-    modules_file = json_location / 'ModulesInfo.json'
+    modules_file = get_json_file(request, 'ModulesInfo.json')
 
-    modules_data = read_json_file(modules_file)
+    modules_data, etag = await run_in_threadpool(read_json_file_with_etag, modules_file)
     if not modules_data:
         raise HTTPException(status_code=404, detail="Cannot read modules file")
 
+    check_etag(request, response, etag)
+
     return ShipModulesResponse(
         timestamp= modules_data.get('timestamp'),
         event= modules_data.get('event'),
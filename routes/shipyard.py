@@ -1,32 +1,30 @@
-from fastapi import APIRouter, HTTPException, Request, Query
-from pathlib import Path
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Request, Response, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, Any, Optional, Tuple
 import logging
 
 from models.shipyard_models import ShipyardResponse, ShipyardLockerResponse
-from utils.file_utils import read_json_file
+from utils.file_utils import read_json_file_with_etag
+from utils.etag import check_etag
+from utils.app_state import get_json_file
 import lang.descriptions_en as desc
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/shipyard", tags=["shipyard"])
 
-def get_json_location(request: Request) -> Path:
-    """Get JSON location from app state."""
-    return request.app.state.json_location
-
-def read_json_data_file(request: Request, file_to_read: str) -> Dict[str, Any]:
-    json_location = get_json_location(request)
-    status_file = json_location / file_to_read
-    data = read_json_file(status_file)
-    return data
+def read_json_data_file(request: Request, file_to_read: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    status_file = get_json_file(request, file_to_read)
+    return read_json_file_with_etag(status_file)
 
 @router.get("/get-ships", response_model=ShipyardResponse)
-async def get_shipyards(request: Request) -> ShipyardResponse:
-    data = read_json_data_file(request, 'Shipyard.json')
+async def get_shipyards(request: Request, response: Response) -> ShipyardResponse:
+    data, etag = await run_in_threadpool(read_json_data_file, request, 'Shipyard.json')
     if not data:
         raise HTTPException(status_code=503, detail="Cannot read status file")
 
+    check_etag(request, response, etag)
+
     return ShipyardResponse(
         timestamp = data.get('timestamp'),
         event= data.get('event'),
@@ -37,11 +35,13 @@ async def get_shipyards(request: Request) -> ShipyardResponse:
     )
 
 @router.get("/get-ship-locker", response_model=ShipyardLockerResponse)
-async def get_shipyard_locker(request: Request) -> ShipyardLockerResponse:
-    data = read_json_data_file(request, 'ShipLocker.json')
+async def get_shipyard_locker(request: Request, response: Response) -> ShipyardLockerResponse:
+    data, etag = await run_in_threadpool(read_json_data_file, request, 'ShipLocker.json')
     if not data:
         raise HTTPException(status_code=503, detail="Cannot read status file")
 
+    check_etag(request, response, etag)
+
     return ShipyardLockerResponse(
         timestamp = data.get('timestamp'),
         event= data.get('event'),
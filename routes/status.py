@@ -1,40 +1,140 @@
+import asyncio
 import importlib
 
-from fastapi import APIRouter, Query, HTTPException, Request
-from pathlib import Path
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, Optional
 import logging
 
 from models.status_models import (StatusResponse, BalanceResponse, FlagsResponse,
-    ScreenResponse, PipsResponse, FuelResponse, DetailedHealthResponse)
+    ScreenResponse, PipsResponse, FuelResponse, DetailedHealthResponse, SnapshotResponse)
 
 
-from utils.file_utils import read_json_file
+from utils.file_utils import read_json_file_cached, read_json_file_with_etag
+from utils.etag import check_etag
 from utils.journal import find_latest_event
+from utils.app_state import get_json_location, get_json_file
 import lang.descriptions_en as desc
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/status", tags=["status"])
 
+# Percentage of the power distributor per half-pip (8 half-pips = 100%)
+PIP_PERCENT = 100 / 8
+
+# Binary digits of every byte value, least significant bit first
+REVERSED_BYTE_BITS = tuple(format(byte, '08b')[::-1] for byte in range(256))
 
-def get_json_location(request: Request) -> Path:
-    """Get JSON location from app state."""
-    return request.app.state.json_location
 
 def read_status_file(request: Request):
-    json_location = get_json_location(request)
-    status_file = json_location / 'Status.json'
-    data = read_json_file(status_file)
+    status_file = get_json_file(request, 'Status.json')
+    data = read_json_file_cached(status_file)
     return data
 
 
-@router.get('/active', response_model=StatusResponse)
-async def get_active(request: Request):
-    """Check if Elite Dangerous is currently running."""
-    data = read_status_file(request)
+def format_flags(flags: int, width: int) -> str:
+    """
+    Format a flags value as binary digits, least significant bit first.
+
+    Builds the string from a per-byte lookup table instead of formatting
+    and reversing the whole value.
+
+    Args:
+        flags: Flags value from Status.json
+        width: Minimum number of digits
+
+    Returns:
+        String where character i is '1' if bit i is set
+    """
+    length = max(width, flags.bit_length())
+    flag_bytes = flags.to_bytes((length + 7) // 8, 'little')
+    return ''.join([REVERSED_BYTE_BITS[byte] for byte in flag_bytes])[:length]
+
+
+def etag_header(response: Response) -> Dict[str, str]:
+    """
+    Copy the ETag set by get_status_data for endpoints returning their own response.
+
+    FastAPI only applies headers from the injected response when the
+    endpoint returns plain data.
+    """
+    etag = response.headers.get('etag')
+    return {'ETag': etag} if etag else {}
+
+
+def get_pips_values(data: Dict[str, Any], scale: float) -> Dict[str, float]:
+    """
+    Read the power distributor pips, defaulting to zeros if Status.json has fewer than three.
+
+    Args:
+        data: Parsed Status.json
+        scale: Multiplier for the raw half-pip counts
+
+    Returns:
+        Dictionary with Systems, Engines and Weapons
+    """
+    pips = data.get('Pips', [0, 0, 0])
+    if len(pips) < 3:
+        pips = [0, 0, 0]
+
+    return {
+        'Systems': pips[0] * scale,
+        'Engines': pips[1] * scale,
+        'Weapons': pips[2] * scale
+    }
+
+
+def get_fuel_values(data: Dict[str, Any], loadout_event: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Work out the main tank's fuel level and capacity.
+
+    Args:
+        data: Parsed Status.json
+        loadout_event: Latest Loadout event from the journal, if any
+
+    Returns:
+        Dictionary with Capacity, Level and Percentage
+    """
+    fuel = data.get('Fuel', {'FuelMain': 0})
+    fuel_main = fuel.get('FuelMain', 0)
+
+    # Get fuel capacity from journal
+    fuel_capacity = 0
+
+    if loadout_event:
+        fuel_capacity = loadout_event.get('FuelCapacity', {}).get('Main', 0)
+
+    # Calculate percentage
+    fuel_percentage = round(100 * (fuel_main / fuel_capacity), 0) if fuel_capacity > 0 else 0
+
+    return {
+        'Capacity': fuel_capacity,
+        'Level': fuel_main,
+        'Percentage': fuel_percentage
+    }
+
+
+def get_status_data(request: Request, response: Response) -> Dict[str, Any]:
+    """
+    Dependency providing the parsed Status.json for a request.
+
+    FastAPI runs this in its threadpool and resolves it once per request.
+    Responses carry an ETag for the file's contents, and a request whose
+    If-None-Match still matches gets a 304 instead.
+    """
+    data, etag = read_json_file_with_etag(get_json_file(request, 'Status.json'))
     if not data:
         raise HTTPException(status_code=503, detail="Cannot read status file")
 
+    check_etag(request, response, etag)
+    return data
+
+
+@router.get('/active', response_model=StatusResponse)
+async def get_active(data: Dict[str, Any] = Depends(get_status_data)):
+    """Check if Elite Dangerous is currently running."""
     # Check if Flags2 exists (indicates game is running)
     is_running = 'Flags2' in data
     value = True if is_running else False
@@ -43,104 +143,61 @@ async def get_active(request: Request):
 
 
 @router.get('/wealth', response_model=BalanceResponse, description=desc.STATUS_WEALTH)
-async def get_wealth(request: Request):
+async def get_wealth(data: Dict[str, Any] = Depends(get_status_data)):
     """Get current balance/wealth."""
-
-    data = read_status_file(request)
-    if not data:
-        raise HTTPException(status_code=503, detail="Cannot read status file")
-
     balance = data.get('Balance', '0')
     return BalanceResponse(Balance=str(balance))
 
 
 @router.get('/flags', response_model=FlagsResponse, description=desc.STATUS_FLAGS)
-async def get_flags(request: Request):
+async def get_flags(response: Response, data: Dict[str, Any] = Depends(get_status_data)):
     """Get current status flags."""
-    data = read_status_file(request)
-    if not data:
-        raise HTTPException(status_code=503, detail="Cannot read status file")
-
     # Process Flags (32-bit)
     flags = data.get('Flags', 0)
-    formatted_flags = format(flags, '032b')[::-1]
+    formatted_flags = format_flags(flags, 32)
 
     # Process Flags2 (19-bit)
     flags2 = data.get('Flags2', 0)
-    formatted_flags2 = format(flags2, '019b')[::-1]
+    formatted_flags2 = format_flags(flags2, 19)
 
-    return FlagsResponse(flags=formatted_flags, flags2=formatted_flags2)
+    # Polled constantly, so skip model validation; response_model still documents it
+    return ORJSONResponse({'flags': formatted_flags, 'flags2': formatted_flags2}, headers=etag_header(response))
 
 
 @router.get('/screen', response_model=ScreenResponse)
-async def get_screen(request: Request):
+async def get_screen(data: Dict[str, Any] = Depends(get_status_data)):
     """Get current GUI focus/screen."""
-    data = read_status_file(request)
-    if not data:
-        raise HTTPException(status_code=503, detail="Cannot read status file")
-
     focus = data.get('GuiFocus', '0')
     return ScreenResponse(Focus=str(focus))
 
 
 @router.get('/pips', response_model=PipsResponse, description=desc.STATUS_PIPS)
-async def get_pips(request: Request, type: str = Query('percent', regex='^(percent|raw)$', description="Request either percentage value or raw value" ) ):
+async def get_pips(response: Response, data: Dict[str, Any] = Depends(get_status_data), type: str = Query('percent', regex='^(percent|raw)$', description="Request either percentage value or raw value" ) ):
     """Get power distribution (pips) information."""
-    data = read_status_file(request)
-    if not data:
-        raise HTTPException(status_code=503, detail="Cannot read status file")
+    # Raw values are half-pip counts, percentages scale them to the full distributor
+    scale = PIP_PERCENT if type == 'percent' else 1
 
-    pips = data.get('Pips', [0, 0, 0])
-
-    if type == 'percent':
-        return PipsResponse(
-            Systems=(pips[0] * 100) / 8,
-            Engines=(pips[1] * 100) / 8,
-            Weapons=(pips[2] * 100) / 8
-        )
-    else:
-        # type is raw
-        return PipsResponse(
-            Systems=float(pips[0]),
-            Engines=float(pips[1]),
-            Weapons=float(pips[2])
-        )
+    # Polled constantly, so skip model validation; response_model still documents it
+    return ORJSONResponse(get_pips_values(data, scale), headers=etag_header(response))
 
 
 @router.get('/fuel', response_model=FuelResponse)
 async def get_fuel(request: Request):
     """Get fuel information."""
-    data = read_status_file(request)
+    # Status.json and the journal are independent reads, so run them together
+    data, loadout_event = await asyncio.gather(
+        run_in_threadpool(read_status_file, request),
+        run_in_threadpool(find_latest_event, get_json_location(request), 'Loadout')
+    )
     if not data:
         raise HTTPException(status_code=503, detail="Cannot read status file")
 
-    fuel = data.get('Fuel', {'FuelMain': 0})
-    fuel_main = fuel.get('FuelMain', 0)
-
-    # Get fuel capacity from journal
-    loadout_event = find_latest_event(get_json_location(request), 'Loadout')
-    fuel_capacity = 0
-
-    if loadout_event:
-        fuel_capacity = loadout_event.get('FuelCapacity', {}).get('Main', 0)
-
-    # Calculate percentage
-    fuel_percentage = round(100 * (fuel_main / fuel_capacity), 0) if fuel_capacity > 0 else 0
-
-    return FuelResponse(
-        Capacity=fuel_capacity,
-        Level=fuel_main,
-        Percentage=fuel_percentage
-    )
+    return FuelResponse(**get_fuel_values(data, loadout_event))
 
 
 @router.get('/health-detailed', response_model=DetailedHealthResponse)
-async def get_detailed_health(request: Request):
+async def get_detailed_health(data: Dict[str, Any] = Depends(get_status_data)):
     """Get detailed health information including shields and hull."""
-    data = read_status_file(request)
-    if not data:
-        raise HTTPException(status_code=503, detail="Cannot read status file")
-
     health = data.get('Health', 1.0)
     shields = data.get('Shields', 0.0)
 
@@ -148,4 +205,32 @@ async def get_detailed_health(request: Request):
         Health=health,
         Shields=shields,
         ShieldsUp=data.get('ShieldsUp', False)
-    )
\ No newline at end of file
+    )
+
+@router.get('/snapshot', response_model=SnapshotResponse)
+async def get_snapshot(request: Request):
+    """
+    Get every status value in one response.
+
+    Meant for clients that poll several /status endpoints each tick; this
+    reads Status.json and the Loadout event once instead of once per call.
+    """
+    data, loadout_event = await asyncio.gather(
+        run_in_threadpool(read_status_file, request),
+        run_in_threadpool(find_latest_event, get_json_location(request), 'Loadout')
+    )
+    if not data:
+        raise HTTPException(status_code=503, detail="Cannot read status file")
+
+    return SnapshotResponse(
+        Active='Flags2' in data,
+        Balance=str(data.get('Balance', '0')),
+        flags=format_flags(data.get('Flags', 0), 32),
+        flags2=format_flags(data.get('Flags2', 0), 19),
+        Focus=str(data.get('GuiFocus', '0')),
+        Pips=PipsResponse(**get_pips_values(data, PIP_PERCENT)),
+        Fuel=FuelResponse(**get_fuel_values(data, loadout_event)),
+        Health=data.get('Health', 1.0),
+        Shields=data.get('Shields', 0.0),
+        ShieldsUp=data.get('ShieldsUp', False)
+    )
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pathlib import Path
 from typing import List, Dict, Optional, Any
-from collections import defaultdict, Counter
+from collections import Counter
+from datetime import datetime
 import logging
+import time
 
 from models.systems_models import (
     ScanBody,
@@ -10,15 +14,19 @@ from models.systems_models import (
     ExplorationStats, FirstDiscoveryReport, FirstDiscoveryBody, FirstDiscoverySystem
 )
 from utils.journal import (
-    get_latest_journal_file,
-    get_all_journal_files,
-    parse_journal_line
+    get_latest_journal_file, get_all_journal_files, get_journal_files, get_journal_etag, SYSTEM_EVENTS
 )
+from utils.exploration_aggregator import (
+    exploration_cache, get_current_system_scans, get_file_stats, get_first_discovery_scan
+)
+from utils.etag import check_etag
 import lang.descriptions_en as desc
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/exploration", tags=["exploration"])
 
+SECONDS_PER_DAY = 24 * 60 * 60
+
 
 @router.get(
     '/current-system',
@@ -26,81 +34,26 @@ router = APIRouter(prefix="/exploration", tags=["exploration"])
     summary="Get Current System Scan Summary",
     description=desc.EXPLORATION_CURRENT_SYSTEM
 )
-async def get_current_system_summary(request: Request):
+async def get_current_system_summary(request: Request, response: Response):
     """
     Get summary of bodies scanned in the current system.
 
     Returns counts of discoveries, planet types, and completion status.
     """
     json_location = request.app.state.json_location
-    journal_file = get_latest_journal_file(json_location)
+    journal_file = await run_in_threadpool(get_latest_journal_file, json_location)
 
     if not journal_file:
         raise HTTPException(status_code=404, detail="No journal file found")
 
-    # Find current system and scans
-    current_system = None
-    system_address = None
-    scans = []
-    fss_body_count = 0
+    etag = await run_in_threadpool(get_journal_etag, json_location)
+    check_etag(request, response, etag)
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                event = data.get('event')
-
-                # Track system changes
-                if event in ('FSDJump', 'Location', 'CarrierJump'):
-                    current_system = data.get('StarSystem')
-                    system_address = data.get('SystemAddress')
-                    scans = []  # Reset scans for new system
-
-                # Track FSS discovery scan
-                elif event == 'FSSDiscoveryScan' and data.get('SystemAddress') == system_address:
-                    fss_body_count = data.get('BodyCount', 0)
-
-                # Track body scans
-                elif event == 'Scan' and data.get('SystemAddress') == system_address:
-                    scans.append(data)
-
-        if not current_system:
-            raise HTTPException(status_code=404, detail="No current system found")
-
-        # Analyze scans
-        first_discoveries = sum(1 for s in scans if not s.get('WasDiscovered', True))
-        first_mapped = sum(1 for s in scans if not s.get('WasMapped', True))
-        first_footfall = sum(1 for s in scans if not s.get('WasFootfalled', True))
-
-        stars = sum(1 for s in scans if s.get('StarType'))
-        planets = sum(1 for s in scans if s.get('PlanetClass'))
-
-        landable = sum(1 for s in scans if s.get('Landable', False))
-        terraformable = sum(1 for s in scans if s.get('TerraformState') and s.get('TerraformState') != '')
-
-        # Count planet types
-        planet_types = Counter(s.get('PlanetClass') for s in scans if s.get('PlanetClass'))
-        star_types = Counter(s.get('StarType') for s in scans if s.get('StarType'))
-
-        return SystemScanSummary(
-            SystemName=current_system,
-            SystemAddress=system_address,
-            TotalBodies=fss_body_count,
-            ScannedBodies=len(scans),
-            FirstDiscoveries=first_discoveries,
-            FirstMapped=first_mapped,
-            FirstFootfall=first_footfall,
-            Stars=stars,
-            Planets=planets,
-            LandableBodies=landable,
-            TerraformableBodies=terraformable,
-            planet_types=dict(planet_types),
-            star_types=dict(star_types)
-        )
+        return await run_in_threadpool(_collect_current_system_summary, journal_file)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error analyzing system: {e}")
         raise HTTPException(status_code=500, detail=f"Error analyzing system: {str(e)}")
@@ -111,62 +64,26 @@ async def get_current_system_summary(request: Request):
     summary="Get Scanned Bodies in Current System",
     description=desc.EXPLORATION_SCANNED_BODIES
 )
-async def get_scanned_bodies(request: Request) -> List[ScanBody]:
+async def get_scanned_bodies(request: Request, response: Response) -> List[ScanBody]:
     """
     Get all bodies scanned in the current system.
 
     Returns detailed information about each scanned body.
     """
     json_location = request.app.state.json_location
-    journal_file = get_latest_journal_file(json_location)
+    journal_file = await run_in_threadpool(get_latest_journal_file, json_location)
 
     if not journal_file:
         raise HTTPException(status_code=404, detail="No journal file found")
 
-    current_system = None
-    system_address = None
-    scans = []
+    etag = await run_in_threadpool(get_journal_etag, json_location)
+    check_etag(request, response, etag)
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                event = data.get('event')
-
-                if event in ('FSDJump', 'Location', 'CarrierJump'):
-                    current_system = data.get('StarSystem')
-                    system_address = data.get('SystemAddress')
-                    scans = []
-
-                elif event == 'Scan' and data.get('SystemAddress') == system_address:
-                    body_type = "Star" if data.get('StarType') else "Planet"
-
-                    scan_body = ScanBody(
-                        BodyName=data.get('BodyName'),
-                        BodyID=data.get('BodyID'),
-                        BodyType=body_type,
-                        StarSystem=data.get('StarSystem'),
-                        SystemAddress=data.get('SystemAddress'),
-                        DistanceFromArrivalLS=data.get('DistanceFromArrivalLS', 0),
-                        WasDiscovered=data.get('WasDiscovered', True),
-                        WasMapped=data.get('WasMapped', True),
-                        WasFootfalled=data.get('WasFootfalled'),
-                        PlanetClass=data.get('PlanetClass'),
-                        TerraformState=data.get('TerraformState'),
-                        Atmosphere=data.get('Atmosphere'),
-                        Landable=data.get('Landable'),
-                        MassEM=data.get('MassEM'),
-                        SurfaceTemperature=data.get('SurfaceTemperature'),
-                        StarType=data.get('StarType'),
-                        StellarMass=data.get('StellarMass')
-                    )
-                    scans.append(scan_body)
-
-        return scans
+        return await run_in_threadpool(_collect_scanned_bodies, journal_file)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting scanned bodies: {e}")
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -177,54 +94,26 @@ async def get_scanned_bodies(request: Request) -> List[ScanBody]:
     summary="Get First Discoveries in Current System",
     description=desc.EXPLORATION_FIRST_DISCOVERIES
 )
-async def get_first_discoveries(request: Request) -> List[DiscoveryStatus]:
+async def get_first_discoveries(request: Request, response: Response) -> List[DiscoveryStatus]:
     """
     Get all first discoveries in the current system.
 
     Returns bodies where you were the first to discover, map, or footfall.
     """
     json_location = request.app.state.json_location
-    journal_file = get_latest_journal_file(json_location)
+    journal_file = await run_in_threadpool(get_latest_journal_file, json_location)
 
     if not journal_file:
         raise HTTPException(status_code=404, detail="No journal file found")
 
-    current_system = None
-    system_address = None
-    discoveries = []
+    etag = await run_in_threadpool(get_journal_etag, json_location)
+    check_etag(request, response, etag)
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = parse_journal_line(line)
-                if not data:
-                    continue
-
-                event = data.get('event')
-
-                if event in ('FSDJump', 'Location', 'CarrierJump'):
-                    current_system = data.get('StarSystem')
-                    system_address = data.get('SystemAddress')
-                    discoveries = []
-
-                elif event == 'Scan' and data.get('SystemAddress') == system_address:
-                    was_discovered = data.get('WasDiscovered', True)
-                    was_mapped = data.get('WasMapped', True)
-                    was_footfalled = data.get('WasFootfalled', True)
-
-                    # Only include if it's a first of something
-                    if not was_discovered or not was_mapped or not was_footfalled:
-                        discoveries.append(DiscoveryStatus(
-                            name=data.get('BodyName'),
-                            first_discovered=not was_discovered,
-                            first_mapped=not was_mapped,
-                            first_footfall=not was_footfalled,
-                            scan_type=data.get('ScanType', 'Unknown'),
-                            timestamp=data.get('timestamp')
-                        ))
-
-        return discoveries
+        return await run_in_threadpool(_collect_first_discoveries, journal_file)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting first discoveries: {e}")
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -238,6 +127,7 @@ async def get_first_discoveries(request: Request) -> List[DiscoveryStatus]:
 )
 async def get_exploration_statistics(
         request: Request,
+        response: Response,
         scan_all_logs: bool = Query(False, description="Scan all journal files (slow)")
 ):
     """
@@ -247,80 +137,19 @@ async def get_exploration_statistics(
     Set scan_all_logs=true to scan all historical journals (this may take time).
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    systems_visited = set()
-    total_scans = 0
-    first_discoveries = 0
-    first_mapped = 0
-    first_footfall = 0
-    planet_types = Counter()
-    star_types = Counter()
-    landable_count = 0
-    terraformable_count = 0
+    etag = await run_in_threadpool(get_journal_etag, json_location)
+    check_etag(request, response, etag)
 
     try:
-        for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    event = data.get('event')
-
-                    if event in ('FSDJump', 'Location', 'CarrierJump'):
-                        system = data.get('StarSystem')
-                        if system:
-                            systems_visited.add(system)
-
-                    elif event == 'Scan':
-                        total_scans += 1
-
-                        if not data.get('WasDiscovered', True):
-                            first_discoveries += 1
-                        if not data.get('WasMapped', True):
-                            first_mapped += 1
-                        if not data.get('WasFootfalled', True):
-                            first_footfall += 1
-
-                        planet_class = data.get('PlanetClass')
-                        if planet_class:
-                            planet_types[planet_class] += 1
-
-                        star_type = data.get('StarType')
-                        if star_type:
-                            star_types[star_type] += 1
-
-                        if data.get('Landable'):
-                            landable_count += 1
-
-                        if data.get('TerraformState') and data.get('TerraformState') != '':
-                            terraformable_count += 1
-
-        most_common_planet = planet_types.most_common(1)[0][0] if planet_types else "None"
-        most_common_star = star_types.most_common(1)[0][0] if star_types else "None"
-
-        return ExplorationStats(
-            total_systems_visited=len(systems_visited),
-            total_bodies_scanned=total_scans,
-            first_discoveries=first_discoveries,
-            first_mapped=first_mapped,
-            first_footfall=first_footfall,
-            most_common_planet_type=most_common_planet,
-            most_common_star_type=most_common_star,
-            landable_bodies_found=landable_count,
-            terraformable_bodies_found=terraformable_count
-        )
+        return await run_in_threadpool(_collect_exploration_statistics, journal_files)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error calculating statistics: {e}")
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -334,6 +163,7 @@ async def get_exploration_statistics(
 )
 async def search_system_history(
         request: Request,
+        response: Response,
         system_name: str = Query(..., description="System name to search for")
 ):
     """
@@ -342,80 +172,16 @@ async def search_system_history(
     Returns the most recent scan summary for the specified system.
     """
     json_location = request.app.state.json_location
-    journal_files = get_all_journal_files(json_location, reverse=True)  # Newest first
+    journal_files = await run_in_threadpool(get_all_journal_files, json_location, True)  # Newest first
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    system_name_lower = system_name.lower()
+    etag = await run_in_threadpool(get_journal_etag, json_location)
+    check_etag(request, response, etag)
 
     try:
-        for journal_file in journal_files:
-            current_system = None
-            system_address = None
-            scans = []
-            fss_body_count = 0
-            found_system = False
-
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    event = data.get('event')
-
-                    if event in ('FSDJump', 'Location', 'CarrierJump'):
-                        sys_name = data.get('StarSystem', '')
-                        if sys_name.lower() == system_name_lower:
-                            current_system = sys_name
-                            system_address = data.get('SystemAddress')
-                            scans = []
-                            fss_body_count = 0
-                            found_system = True
-                        elif found_system:
-                            # Moved to different system, analyze what we found
-                            break
-
-                    elif found_system:
-                        if event == 'FSSDiscoveryScan' and data.get('SystemAddress') == system_address:
-                            fss_body_count = data.get('BodyCount', 0)
-
-                        elif event == 'Scan' and data.get('SystemAddress') == system_address:
-                            scans.append(data)
-
-            if found_system and current_system:
-                # Found the system, analyze it
-                first_discoveries = sum(1 for s in scans if not s.get('WasDiscovered', True))
-                first_mapped = sum(1 for s in scans if not s.get('WasMapped', True))
-                first_footfall = sum(1 for s in scans if not s.get('WasFootfalled', True))
-
-                stars = sum(1 for s in scans if s.get('StarType'))
-                planets = sum(1 for s in scans if s.get('PlanetClass'))
-
-                landable = sum(1 for s in scans if s.get('Landable', False))
-                terraformable = sum(1 for s in scans if s.get('TerraformState') and s.get('TerraformState') != '')
-
-                planet_types = Counter(s.get('PlanetClass') for s in scans if s.get('PlanetClass'))
-                star_types = Counter(s.get('StarType') for s in scans if s.get('StarType'))
-
-                return SystemScanSummary(
-                    SystemName=current_system,
-                    SystemAddress=system_address,
-                    TotalBodies=fss_body_count,
-                    ScannedBodies=len(scans),
-                    FirstDiscoveries=first_discoveries,
-                    FirstMapped=first_mapped,
-                    FirstFootfall=first_footfall,
-                    Stars=stars,
-                    Planets=planets,
-                    LandableBodies=landable,
-                    TerraformableBodies=terraformable,
-                    planet_types=dict(planet_types),
-                    star_types=dict(star_types)
-                )
-
-        raise HTTPException(status_code=404, detail=f"System '{system_name}' not found in journal history")
+        return await run_in_threadpool(_search_system_history, journal_files, system_name)
 
     except HTTPException:
         raise
@@ -431,6 +197,7 @@ async def search_system_history(
 )
 async def get_planet_type_distribution(
         request: Request,
+        response: Response,
         scan_all_logs: bool = Query(False, description="Scan all journal files")
 ) -> Dict[str, int]:
     """
@@ -439,30 +206,19 @@ async def get_planet_type_distribution(
     Returns count of each planet class encountered.
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    planet_types = Counter()
+    etag = await run_in_threadpool(get_journal_etag, json_location)
+    check_etag(request, response, etag)
 
     try:
-        for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if data and data.get('event') == 'Scan':
-                        planet_class = data.get('PlanetClass')
-                        if planet_class:
-                            planet_types[planet_class] += 1
-
-        return dict(planet_types.most_common())
+        return await run_in_threadpool(_collect_planet_types, journal_files)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting planet types: {e}")
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -475,6 +231,7 @@ async def get_planet_type_distribution(
 )
 async def get_valuable_finds(
         request: Request,
+        response: Response,
         scan_all_logs: bool = Query(False, description="Scan all journal files")
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
@@ -483,59 +240,19 @@ async def get_valuable_finds(
     Returns categorized list of high-value bodies.
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    valuable = {
-        'earth_like': [],
-        'water_worlds': [],
-        'ammonia_worlds': [],
-        'terraformable': [],
-        'first_discoveries': []
-    }
+    etag = await run_in_threadpool(get_journal_etag, json_location)
+    check_etag(request, response, etag)
 
     try:
-        for journal_file in journal_files:
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data or data.get('event') != 'Scan':
-                        continue
-
-                    planet_class = data.get('PlanetClass', '')
-                    terraform = data.get('TerraformState', '')
-                    body_name = data.get('BodyName')
-                    system = data.get('StarSystem')
-                    first_discovered = not data.get('WasDiscovered', True)
-
-                    body_info = {
-                        'body': body_name,
-                        'system': system,
-                        'first_discovered': first_discovered
-                    }
-
-                    if planet_class == 'Earthlike body':
-                        valuable['earth_like'].append(body_info)
-                    elif planet_class == 'Water world':
-                        valuable['water_worlds'].append(body_info)
-                    elif planet_class == 'Ammonia world':
-                        valuable['ammonia_worlds'].append(body_info)
-
-                    if terraform and terraform != '':
-                        valuable['terraformable'].append(body_info)
-
-                    if first_discovered:
-                        valuable['first_discoveries'].append(body_info)
-
-        return valuable
+        return await run_in_threadpool(_collect_valuable_finds, journal_files)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting valuable finds: {e}")
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -549,6 +266,7 @@ async def get_valuable_finds(
 )
 async def generate_first_discovery_report(
         request: Request,
+        response: Response,
         scan_all_logs: bool = Query(True, description="Scan all journal files (recommended)"),
         include_already_discovered: bool = Query(False,
                                                  description="Include systems where some bodies were already discovered")
@@ -566,240 +284,21 @@ async def generate_first_discovery_report(
     **Note:** This may take 30-60 seconds for extensive exploration history.
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    from datetime import datetime
-    from collections import defaultdict
-
-    systems_data = defaultdict(lambda: {
-        'system_name': '',
-        'system_address': 0,
-        'visit_timestamp': '',
-        'bodies': [],
-        'fss_body_count': 0
-    })
-
-    first_timestamp = None
-    last_timestamp = None
+    etag = await run_in_threadpool(get_journal_etag, json_location)
+    check_etag(request, response, etag)
 
     try:
-        for journal_file in journal_files:
-            current_system = None
-            system_address = None
-
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    event = data.get('event')
-                    timestamp = data.get('timestamp')
-
-                    if not first_timestamp:
-                        first_timestamp = timestamp
-                    last_timestamp = timestamp
-
-                    # Track system entry
-                    if event in ('FSDJump', 'Location', 'CarrierJump'):
-                        current_system = data.get('StarSystem')
-                        system_address = data.get('SystemAddress')
-
-                        if system_address and current_system:
-                            systems_data[system_address]['system_name'] = current_system
-                            systems_data[system_address]['system_address'] = system_address
-                            systems_data[system_address]['visit_timestamp'] = timestamp
-
-                    # Track FSS scan
-                    elif event == 'FSSDiscoveryScan' and system_address:
-                        systems_data[system_address]['fss_body_count'] = data.get('BodyCount', 0)
-
-                    # Track body scans
-                    elif event == 'Scan' and system_address:
-                        # Only include if there's a first discovery/mapping/footfall
-                        was_discovered = data.get('WasDiscovered', True)
-                        was_mapped = data.get('WasMapped', True)
-                        was_footfalled = data.get('WasFootfalled', True)
-
-                        if not was_discovered or not was_mapped or not was_footfalled or include_already_discovered:
-                            systems_data[system_address]['bodies'].append(data)
-
-        # Process systems into structured report
-        report_systems = []
-        total_first_discoveries = 0
-        total_first_mapped = 0
-        total_first_footfall = 0
-        earth_like_count = 0
-        water_world_count = 0
-        ammonia_world_count = 0
-        terraformable_count = 0
-
-        for sys_addr, sys_data in systems_data.items():
-            if not sys_data['bodies']:
-                continue
-
-            # Process bodies
-            stars = []
-            planets = []
-            moons = []
-
-            first_disc_count = 0
-            first_map_count = 0
-            first_foot_count = 0
-
-            planet_types = Counter()
-            star_types = Counter()
-
-            has_earth_like = False
-            has_water_world = False
-            has_ammonia_world = False
-            landable_count = 0
-            terraform_count = 0
-
-            for body_data in sys_data['bodies']:
-                # Determine body type
-                is_star = bool(body_data.get('StarType'))
-                is_moon = len(body_data.get('Parents', [])) > 2  # Moons have multiple parents
-                body_type = "Star" if is_star else ("Moon" if is_moon else "Planet")
-
-                # Count discoveries
-                if not body_data.get('WasDiscovered', True):
-                    first_disc_count += 1
-                    total_first_discoveries += 1
-                if not body_data.get('WasMapped', True):
-                    first_map_count += 1
-                    total_first_mapped += 1
-                if not body_data.get('WasFootfalled', True):
-                    first_foot_count += 1
-                    total_first_footfall += 1
-
-                # Check for valuable bodies
-                planet_class = body_data.get('PlanetClass', '')
-                if planet_class == 'Earthlike body':
-                    has_earth_like = True
-                    earth_like_count += 1
-                elif planet_class == 'Water world':
-                    has_water_world = True
-                    water_world_count += 1
-                elif planet_class == 'Ammonia world':
-                    has_ammonia_world = True
-                    ammonia_world_count += 1
-
-                if body_data.get('TerraformState') and body_data.get('TerraformState') != '':
-                    terraform_count += 1
-                    terraformable_count += 1
-
-                if body_data.get('Landable'):
-                    landable_count += 1
-
-                # Count types
-                if planet_class:
-                    planet_types[planet_class] += 1
-                if body_data.get('StarType'):
-                    star_types[body_data.get('StarType')] += 1
-
-                # Extract signals
-                signals = None
-                if body_data.get('Signals'):
-                    signals = [s.get('Type_Localised', s.get('Type')) for s in body_data.get('Signals', [])]
-
-                # Create body record
-                body_record = FirstDiscoveryBody(
-                    body_name=body_data.get('BodyName'),
-                    body_id=body_data.get('BodyID'),
-                    body_type=body_type,
-                    scan_type=body_data.get('ScanType', 'Unknown'),
-                    timestamp=body_data.get('timestamp'),
-                    distance_ls=body_data.get('DistanceFromArrivalLS', 0),
-                    first_discovered=not body_data.get('WasDiscovered', True),
-                    first_mapped=not body_data.get('WasMapped', True),
-                    first_footfall=not body_data.get('WasFootfalled', True),
-                    planet_class=body_data.get('PlanetClass'),
-                    atmosphere=body_data.get('Atmosphere'),
-                    volcanism=body_data.get('Volcanism'),
-                    landable=body_data.get('Landable'),
-                    terraform_state=body_data.get('TerraformState'),
-                    mass_em=body_data.get('MassEM'),
-                    radius=body_data.get('Radius'),
-                    surface_gravity=body_data.get('SurfaceGravity'),
-                    surface_temp=body_data.get('SurfaceTemperature'),
-                    surface_pressure=body_data.get('SurfacePressure'),
-                    star_type=body_data.get('StarType'),
-                    star_class=body_data.get('Subclass'),
-                    stellar_mass=body_data.get('StellarMass'),
-                    luminosity=body_data.get('Luminosity'),
-                    age_my=body_data.get('Age_MY'),
-                    has_rings=bool(body_data.get('Rings')),
-                    ring_count=len(body_data.get('Rings', [])),
-                    signals=signals,
-                    materials=body_data.get('Materials')
-                )
-
-                if is_star:
-                    stars.append(body_record)
-                elif is_moon:
-                    moons.append(body_record)
-                else:
-                    planets.append(body_record)
-
-            # Create system record
-            system_record = FirstDiscoverySystem(
-                system_name=sys_data['system_name'],
-                system_address=sys_data['system_address'],
-                visit_timestamp=sys_data['visit_timestamp'],
-                total_bodies=sys_data['fss_body_count'],
-                bodies_scanned=len(sys_data['bodies']),
-                first_discoveries_count=first_disc_count,
-                first_mapped_count=first_map_count,
-                first_footfall_count=first_foot_count,
-                star_count=len(stars),
-                planet_count=len(planets),
-                landable_count=landable_count,
-                terraformable_count=terraform_count,
-                has_earth_like=has_earth_like,
-                has_water_world=has_water_world,
-                has_ammonia_world=has_ammonia_world,
-                stars=stars,
-                planets=planets,
-                moons=moons,
-                planet_type_breakdown=dict(planet_types),
-                star_type_breakdown=dict(star_types)
-            )
-
-            report_systems.append(system_record)
-
-        # Sort systems by visit timestamp (most recent first)
-        report_systems.sort(key=lambda x: x.visit_timestamp, reverse=True)
-
-        return FirstDiscoveryReport(
-            generated_at=datetime.now().isoformat(),
-            scan_date_range={
-                'start': first_timestamp or '',
-                'end': last_timestamp or ''
-            },
-            total_systems=len(report_systems),
-            total_first_discoveries=total_first_discoveries,
-            total_first_mapped=total_first_mapped,
-            total_first_footfall=total_first_footfall,
-            earth_like_count=earth_like_count,
-            water_world_count=water_world_count,
-            ammonia_world_count=ammonia_world_count,
-            terraformable_count=terraformable_count,
-            systems=report_systems
-        )
+        return await run_in_threadpool(_build_first_discovery_report, journal_files, include_already_discovered)
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error generating first discovery report: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error generating first discovery report: {e}")
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
@@ -810,8 +309,11 @@ async def generate_first_discovery_report(
 )
 async def get_first_discovery_systems(
         request: Request,
+        response: Response,
         scan_all_logs: bool = Query(True, description="Scan all journal files"),
-        min_discoveries: int = Query(1, ge=1, description="Minimum first discoveries to include system")
+        min_discoveries: int = Query(1, ge=1, description="Minimum first discoveries to include system"),
+        since_days: Optional[int] = Query(None, ge=1,
+                                          description="Only scan journals written in the last N days")
 ) -> List[Dict[str, Any]]:
     """
     Get simplified list of systems with first discoveries.
@@ -820,85 +322,501 @@ async def get_first_discovery_systems(
     Faster than the full report.
     """
     json_location = request.app.state.json_location
-
-    if scan_all_logs:
-        journal_files = get_all_journal_files(json_location)
-    else:
-        latest = get_latest_journal_file(json_location)
-        journal_files = [latest] if latest else []
+    since = time.time() - since_days * SECONDS_PER_DAY if since_days else None
+    journal_files = await run_in_threadpool(get_journal_files, json_location, scan_all_logs, since)
 
     if not journal_files:
         raise HTTPException(status_code=404, detail="No journal files found")
 
-    from collections import defaultdict
-
-    systems = defaultdict(lambda: {
-        'system_name': '',
-        'visit_timestamp': '',
-        'first_discoveries': 0,
-        'first_mapped': 0,
-        'first_footfall': 0,
-        'bodies_scanned': 0,
-        'valuable_finds': []
-    })
+    # A time window picks its own subset of journals, so the tag has to cover it
+    window_files = journal_files if since is not None else None
+    etag = await run_in_threadpool(get_journal_etag, json_location, window_files)
+    check_etag(request, response, etag)
 
     try:
-        for journal_file in journal_files:
-            current_system = None
-            system_address = None
-
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    data = parse_journal_line(line)
-                    if not data:
-                        continue
-
-                    event = data.get('event')
-
-                    if event in ('FSDJump', 'Location', 'CarrierJump'):
-                        current_system = data.get('StarSystem')
-                        system_address = data.get('SystemAddress')
-
-                        if system_address:
-                            systems[system_address]['system_name'] = current_system
-                            systems[system_address]['visit_timestamp'] = data.get('timestamp')
-
-                    elif event == 'Scan' and system_address:
-                        if not data.get('WasDiscovered', True):
-                            systems[system_address]['first_discoveries'] += 1
-                        if not data.get('WasMapped', True):
-                            systems[system_address]['first_mapped'] += 1
-                        if not data.get('WasFootfalled', True):
-                            systems[system_address]['first_footfall'] += 1
-
-                        systems[system_address]['bodies_scanned'] += 1
-
-                        # Track valuable finds
-                        planet_class = data.get('PlanetClass', '')
-                        if planet_class in ('Earthlike body', 'Water world', 'Ammonia world'):
-                            if planet_class not in systems[system_address]['valuable_finds']:
-                                systems[system_address]['valuable_finds'].append(planet_class)
-
-        # Filter and format results
-        result = []
-        for sys_addr, sys_data in systems.items():
-            if sys_data['first_discoveries'] >= min_discoveries:
-                result.append({
-                    'system_name': sys_data['system_name'],
-                    'system_address': sys_addr,
-                    'visit_timestamp': sys_data['visit_timestamp'],
-                    'first_discoveries': sys_data['first_discoveries'],
-                    'first_mapped': sys_data['first_mapped'],
-                    'first_footfall': sys_data['first_footfall'],
-                    'bodies_scanned': sys_data['bodies_scanned'],
-                    'valuable_finds': sys_data['valuable_finds']
-                })
-
-        # Sort by first discoveries (most first)
-        result.sort(key=lambda x: x['first_discoveries'], reverse=True)
-
-        return result
+        return await run_in_threadpool(_collect_first_discovery_systems, journal_files, min_discoveries)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting first discovery systems: {e}")
-        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+
+
+def _collect_current_system_summary(journal_file: Path) -> SystemScanSummary:
+    """Summarize the scans in the current system."""
+    current = get_current_system_scans(journal_file)
+
+    if not current.system_name:
+        raise HTTPException(status_code=404, detail="No current system found")
+
+    return _summarize_scans(current.system_name, current.system_address, current.fss_body_count, current.scans)
+
+
+def _collect_scanned_bodies(journal_file: Path) -> List[ScanBody]:
+    """Build the scanned body list for the current system."""
+    scans = []
+
+    for data in get_current_system_scans(journal_file).scans:
+        body_type = "Star" if data.get('StarType') else "Planet"
+
+        scan_body = ScanBody.model_construct(
+            BodyName=data.get('BodyName'),
+            BodyID=data.get('BodyID'),
+            BodyType=body_type,
+            StarSystem=data.get('StarSystem'),
+            SystemAddress=data.get('SystemAddress'),
+            DistanceFromArrivalLS=data.get('DistanceFromArrivalLS', 0),
+            WasDiscovered=data.get('WasDiscovered', True),
+            WasMapped=data.get('WasMapped', True),
+            WasFootfalled=data.get('WasFootfalled'),
+            PlanetClass=data.get('PlanetClass'),
+            TerraformState=data.get('TerraformState'),
+            Atmosphere=data.get('Atmosphere'),
+            Landable=data.get('Landable'),
+            MassEM=data.get('MassEM'),
+            SurfaceTemperature=data.get('SurfaceTemperature'),
+            StarType=data.get('StarType'),
+            StellarMass=data.get('StellarMass')
+        )
+        scans.append(scan_body)
+
+    return scans
+
+
+def _collect_first_discoveries(journal_file: Path) -> List[DiscoveryStatus]:
+    """Find the bodies in the current system with a first discovery, mapping or footfall."""
+    discoveries = []
+
+    for data in get_current_system_scans(journal_file).scans:
+        was_discovered = data.get('WasDiscovered', True)
+        was_mapped = data.get('WasMapped', True)
+        was_footfalled = data.get('WasFootfalled', True)
+
+        # Only include if it's a first of something
+        if not was_discovered or not was_mapped or not was_footfalled:
+            discoveries.append(DiscoveryStatus.model_construct(
+                name=data.get('BodyName'),
+                first_discovered=not was_discovered,
+                first_mapped=not was_mapped,
+                first_footfall=not was_footfalled,
+                scan_type=data.get('ScanType', 'Unknown'),
+                timestamp=data.get('timestamp')
+            ))
+
+    return discoveries
+
+
+def _collect_exploration_statistics(journal_files: List[Path]) -> ExplorationStats:
+    """Merge the exploration counts of the journal files."""
+    systems_visited = set()
+    total_scans = 0
+    first_discoveries = 0
+    first_mapped = 0
+    first_footfall = 0
+    planet_types = Counter()
+    star_types = Counter()
+    landable_count = 0
+    terraformable_count = 0
+
+    # Merge the per-file counts; unchanged journals come from the cache
+    for journal_file in journal_files:
+        file_stats = get_file_stats(journal_file)
+
+        systems_visited |= file_stats.systems_visited
+        total_scans += file_stats.total_scans
+        first_discoveries += file_stats.first_discoveries
+        first_mapped += file_stats.first_mapped
+        first_footfall += file_stats.first_footfall
+        planet_types.update(file_stats.planet_types)
+        star_types.update(file_stats.star_types)
+        landable_count += file_stats.landable_count
+        terraformable_count += file_stats.terraformable_count
+
+    most_common_planet = planet_types.most_common(1)[0][0] if planet_types else "None"
+    most_common_star = star_types.most_common(1)[0][0] if star_types else "None"
+
+    return ExplorationStats(
+        total_systems_visited=len(systems_visited),
+        total_bodies_scanned=total_scans,
+        first_discoveries=first_discoveries,
+        first_mapped=first_mapped,
+        first_footfall=first_footfall,
+        most_common_planet_type=most_common_planet,
+        most_common_star_type=most_common_star,
+        landable_bodies_found=landable_count,
+        terraformable_bodies_found=terraformable_count
+    )
+
+
+def _search_system_history(journal_files: List[Path], system_name: str) -> SystemScanSummary:
+    """Find the most recent visit to a system, searching the journal files in the order given."""
+    system_name_lower = system_name.lower()
+
+    for journal_file in journal_files:
+        # Skip journals that never visit the system without walking their events
+        if system_name_lower not in get_file_stats(journal_file).system_names_lower:
+            continue
+
+        current_system = None
+        system_address = None
+        scans = []
+        fss_body_count = 0
+        found_system = False
+
+        for data in exploration_cache.load(journal_file):
+            event = data.get('event')
+
+            if event in SYSTEM_EVENTS:
+                sys_name = data.get('StarSystem', '')
+                if sys_name.lower() == system_name_lower:
+                    current_system = sys_name
+                    system_address = data.get('SystemAddress')
+                    scans = []
+                    fss_body_count = 0
+                    found_system = True
+                elif found_system:
+                    # Moved to different system, analyze what we found
+                    break
+
+            elif found_system:
+                if event == 'FSSDiscoveryScan' and data.get('SystemAddress') == system_address:
+                    fss_body_count = data.get('BodyCount', 0)
+
+                elif event == 'Scan' and data.get('SystemAddress') == system_address:
+                    scans.append(data)
+
+        if found_system and current_system:
+            # Found the system, analyze it
+            return _summarize_scans(current_system, system_address, fss_body_count, scans)
+
+    raise HTTPException(status_code=404, detail=f"System '{system_name}' not found in journal history")
+
+
+def _collect_planet_types(journal_files: List[Path]) -> Dict[str, int]:
+    """Count planet classes across the journal files, most common first."""
+    planet_types = Counter()
+
+    for journal_file in journal_files:
+        planet_types.update(get_file_stats(journal_file).planet_types)
+
+    return dict(planet_types.most_common())
+
+
+def _collect_valuable_finds(journal_files: List[Path]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group the valuable bodies scanned in the journal files."""
+    valuable = {
+        'earth_like': [],
+        'water_worlds': [],
+        'ammonia_worlds': [],
+        'terraformable': [],
+        'first_discoveries': []
+    }
+
+    for journal_file in journal_files:
+        for data in exploration_cache.load(journal_file):
+            if data.get('event') != 'Scan':
+                continue
+
+            planet_class = data.get('PlanetClass', '')
+            terraform = data.get('TerraformState', '')
+            body_name = data.get('BodyName')
+            system = data.get('StarSystem')
+            first_discovered = not data.get('WasDiscovered', True)
+
+            body_info = {
+                'body': body_name,
+                'system': system,
+                'first_discovered': first_discovered
+            }
+
+            if planet_class == 'Earthlike body':
+                valuable['earth_like'].append(body_info)
+            elif planet_class == 'Water world':
+                valuable['water_worlds'].append(body_info)
+            elif planet_class == 'Ammonia world':
+                valuable['ammonia_worlds'].append(body_info)
+
+            if terraform and terraform != '':
+                valuable['terraformable'].append(body_info)
+
+            if first_discovered:
+                valuable['first_discoveries'].append(body_info)
+
+    return valuable
+
+
+def _build_first_discovery_report(journal_files: List[Path], include_already_discovered: bool) -> FirstDiscoveryReport:
+    """Build the first discovery report for the journal files."""
+    scan = get_first_discovery_scan(journal_files)
+
+    # Process systems into structured report
+    report_systems = []
+    total_first_discoveries = 0
+    total_first_mapped = 0
+    total_first_footfall = 0
+    earth_like_count = 0
+    water_world_count = 0
+    ammonia_world_count = 0
+    terraformable_count = 0
+
+    for sys_data in scan.systems.values():
+        if include_already_discovered:
+            bodies = sys_data.scans
+        else:
+            # Only include if there's a first discovery/mapping/footfall
+            bodies = [
+                body_data for body_data in sys_data.scans
+                if not body_data.get('WasDiscovered', True)
+                or not body_data.get('WasMapped', True)
+                or not body_data.get('WasFootfalled', True)
+            ]
+
+        if not bodies:
+            continue
+
+        # Process bodies
+        stars = []
+        planets = []
+        moons = []
+
+        first_disc_count = 0
+        first_map_count = 0
+        first_foot_count = 0
+
+        planet_types = Counter()
+        star_types = Counter()
+
+        has_earth_like = False
+        has_water_world = False
+        has_ammonia_world = False
+        landable_count = 0
+        terraform_count = 0
+
+        for body_data in bodies:
+            get = body_data.get
+
+            # Each field is read once and shared by the counters and the record
+            star_type = get('StarType')
+            planet_class = get('PlanetClass')
+            terraform_state = get('TerraformState')
+            landable = get('Landable')
+            rings = get('Rings')
+            first_discovered = not get('WasDiscovered', True)
+            first_mapped = not get('WasMapped', True)
+            first_footfall = not get('WasFootfalled', True)
+
+            # Determine body type
+            is_star = bool(star_type)
+            is_moon = len(get('Parents', [])) > 2  # Moons have multiple parents
+            body_type = "Star" if is_star else ("Moon" if is_moon else "Planet")
+
+            # Count discoveries
+            if first_discovered:
+                first_disc_count += 1
+            if first_mapped:
+                first_map_count += 1
+            if first_footfall:
+                first_foot_count += 1
+
+            # Check for valuable bodies
+            if planet_class == 'Earthlike body':
+                has_earth_like = True
+                earth_like_count += 1
+            elif planet_class == 'Water world':
+                has_water_world = True
+                water_world_count += 1
+            elif planet_class == 'Ammonia world':
+                has_ammonia_world = True
+                ammonia_world_count += 1
+
+            if terraform_state:
+                terraform_count += 1
+
+            if landable:
+                landable_count += 1
+
+            # Count types
+            if planet_class:
+                planet_types[planet_class] += 1
+            if star_type:
+                star_types[star_type] += 1
+
+            # Extract signals
+            signals = None
+            body_signals = get('Signals')
+            if body_signals:
+                signals = [s.get('Type_Localised', s.get('Type')) for s in body_signals]
+
+            # Create body record; FastAPI validates the whole report on the
+            # way out, so skip validating each body here as well
+            body_record = FirstDiscoveryBody.model_construct(
+                body_name=get('BodyName'),
+                body_id=get('BodyID'),
+                body_type=body_type,
+                scan_type=get('ScanType', 'Unknown'),
+                timestamp=get('timestamp'),
+                distance_ls=get('DistanceFromArrivalLS', 0),
+                first_discovered=first_discovered,
+                first_mapped=first_mapped,
+                first_footfall=first_footfall,
+                planet_class=planet_class,
+                atmosphere=get('Atmosphere'),
+                volcanism=get('Volcanism'),
+                landable=landable,
+                terraform_state=terraform_state,
+                mass_em=get('MassEM'),
+                radius=get('Radius'),
+                surface_gravity=get('SurfaceGravity'),
+                surface_temp=get('SurfaceTemperature'),
+                surface_pressure=get('SurfacePressure'),
+                star_type=star_type,
+                star_class=get('Subclass'),
+                stellar_mass=get('StellarMass'),
+                luminosity=get('Luminosity'),
+                age_my=get('Age_MY'),
+                has_rings=bool(rings),
+                ring_count=len(rings) if rings else 0,
+                signals=signals,
+                materials=get('Materials')
+            )
+
+            if is_star:
+                stars.append(body_record)
+            elif is_moon:
+                moons.append(body_record)
+            else:
+                planets.append(body_record)
+
+        total_first_discoveries += first_disc_count
+        total_first_mapped += first_map_count
+        total_first_footfall += first_foot_count
+        terraformable_count += terraform_count
+
+        # Create system record
+        system_record = FirstDiscoverySystem.model_construct(
+            system_name=sys_data.system_name,
+            system_address=sys_data.system_address,
+            visit_timestamp=sys_data.visit_timestamp,
+            total_bodies=sys_data.fss_body_count,
+            bodies_scanned=len(bodies),
+            first_discoveries_count=first_disc_count,
+            first_mapped_count=first_map_count,
+            first_footfall_count=first_foot_count,
+            star_count=len(stars),
+            planet_count=len(planets),
+            landable_count=landable_count,
+            terraformable_count=terraform_count,
+            has_earth_like=has_earth_like,
+            has_water_world=has_water_world,
+            has_ammonia_world=has_ammonia_world,
+            stars=stars,
+            planets=planets,
+            moons=moons,
+            planet_type_breakdown=dict(planet_types),
+            star_type_breakdown=dict(star_types)
+        )
+
+        report_systems.append(system_record)
+
+    # Sort systems by visit timestamp (most recent first)
+    report_systems.sort(key=lambda x: x.visit_timestamp, reverse=True)
+
+    return FirstDiscoveryReport(
+        generated_at=datetime.now().isoformat(),
+        scan_date_range={
+            'start': scan.first_timestamp or '',
+            'end': scan.last_timestamp or ''
+        },
+        total_systems=len(report_systems),
+        total_first_discoveries=total_first_discoveries,
+        total_first_mapped=total_first_mapped,
+        total_first_footfall=total_first_footfall,
+        earth_like_count=earth_like_count,
+        water_world_count=water_world_count,
+        ammonia_world_count=ammonia_world_count,
+        terraformable_count=terraformable_count,
+        systems=report_systems
+    )
+
+
+def _collect_first_discovery_systems(journal_files: List[Path], min_discoveries: int) -> List[Dict[str, Any]]:
+    """List the systems with at least min_discoveries first discoveries."""
+    # Filter and format results
+    result = []
+    for sys_addr, sys_data in get_first_discovery_scan(journal_files).systems.items():
+        if sys_data.first_discoveries >= min_discoveries:
+            result.append({
+                'system_name': sys_data.system_name,
+                'system_address': sys_addr,
+                'visit_timestamp': sys_data.visit_timestamp,
+                'first_discoveries': sys_data.first_discoveries,
+                'first_mapped': sys_data.first_mapped,
+                'first_footfall': sys_data.first_footfall,
+                'bodies_scanned': len(sys_data.scans),
+                'valuable_finds': list(sys_data.valuable_finds)
+            })
+
+    # Sort by first discoveries (most first)
+    result.sort(key=lambda x: x['first_discoveries'], reverse=True)
+
+    return result
+
+
+def _summarize_scans(
+        system_name: str,
+        system_address: Optional[int],
+        fss_body_count: int,
+        scans: List[Dict[str, Any]]
+) -> SystemScanSummary:
+    """Count discoveries and body types for a system's Scan events in one pass."""
+    first_discoveries = 0
+    first_mapped = 0
+    first_footfall = 0
+    stars = 0
+    planets = 0
+    landable = 0
+    terraformable = 0
+    planet_types = Counter()
+    star_types = Counter()
+
+    for scan in scans:
+        get = scan.get
+
+        if not get('WasDiscovered', True):
+            first_discoveries += 1
+        if not get('WasMapped', True):
+            first_mapped += 1
+        if not get('WasFootfalled', True):
+            first_footfall += 1
+
+        star_type = get('StarType')
+        if star_type:
+            stars += 1
+            star_types[star_type] += 1
+
+        planet_class = get('PlanetClass')
+        if planet_class:
+            planets += 1
+            planet_types[planet_class] += 1
+
+        if get('Landable', False):
+            landable += 1
+        if get('TerraformState'):
+            terraformable += 1
+
+    return SystemScanSummary.model_construct(
+        SystemName=system_name,
+        SystemAddress=system_address,
+        TotalBodies=fss_body_count,
+        ScannedBodies=len(scans),
+        FirstDiscoveries=first_discoveries,
+        FirstMapped=first_mapped,
+        FirstFootfall=first_footfall,
+        Stars=stars,
+        Planets=planets,
+        LandableBodies=landable,
+        TerraformableBodies=terraformable,
+        planet_types=dict(planet_types),
+        star_types=dict(star_types)
+    )
@@ -0,0 +1,21 @@
+from fastapi import Request
+from pathlib import Path
+
+
+def get_json_location(request: Request) -> Path:
+    """Get JSON location from app state."""
+    return request.app.state.json_location
+
+
+def get_json_file(request: Request, name: str) -> Path:
+    """
+    Get the path of one of the game's JSON files from app state.
+
+    Args:
+        request: Current request
+        name: File name, one of main.JSON_FILE_NAMES
+
+    Returns:
+        Path built once at startup
+    """
+    return request.app.state.json_files[name]
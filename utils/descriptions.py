@@ -17,6 +17,8 @@ class DescriptionLoader:
         """
         self.language = language
         self._module = None
+        # Descriptions already resolved from the loaded module
+        self._cache = {}
         self._load_language(language)
 
     def _load_language(self, language: str):
@@ -24,22 +26,30 @@ class DescriptionLoader:
         try:
             module_name = f"descriptions_{language}"
             self._module = importlib.import_module(module_name)
+            self._cache.clear()
             logger.info(f"Loaded descriptions for language: {language}")
         except ImportError:
             logger.warning(f"Language '{language}' not found, falling back to English")
             try:
                 self._module = importlib.import_module("descriptions_en")
+                self._cache.clear()
             except ImportError:
                 logger.error("English fallback not found!")
                 raise
 
     def __getattr__(self, name: str) -> Any:
         """Get description attribute from loaded module."""
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
         if self._module is None:
             raise RuntimeError("No description module loaded")
 
         try:
-            return getattr(self._module, name)
+            value = self._cache[name] = getattr(self._module, name)
+            return value
         except AttributeError:
             logger.warning(f"Description '{name}' not found in {self.language}")
             return f"Description not available ({name})"
@@ -64,7 +74,7 @@ class DescriptionProxy:
         if _desc_loader is None:
             # Return empty string if not initialized yet
             # This allows routes to be imported before initialization
-            logger.debug(f"Description '{name}' accessed before initialization")
+            logger.debug("Description '%s' accessed before initialization", name)
             return ""
         return getattr(_desc_loader, name)
 
@@ -0,0 +1,29 @@
+from fastapi import HTTPException, Request, Response
+from typing import Optional
+
+
+def check_etag(request: Request, response: Response, etag: Optional[str]):
+    """
+    Handle conditional requests for a resource with the given ETag.
+
+    Polling clients that send back the ETag they last saw get an empty
+    304 Not Modified instead of the same body again.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        response: Response to add the ETag header to
+        etag: Current ETag of the resource, or None to skip the check
+
+    Raises:
+        HTTPException: 304 if the client's copy is still current
+    """
+    if etag is None:
+        return
+
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match:
+        client_etags = {tag.strip() for tag in if_none_match.split(',')}
+        if etag in client_etags or '*' in client_etags:
+            raise HTTPException(status_code=304, headers={'ETag': etag})
+
+    response.headers['ETag'] = etag
@@ -0,0 +1,298 @@
+from functools import lru_cache
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+from utils.journal import JournalCache, SYSTEM_EVENTS
+
+# Events read by the exploration endpoints
+EXPLORATION_EVENTS = SYSTEM_EVENTS | {'FSSDiscoveryScan', 'Scan'}
+
+# Planet classes listed as valuable finds for first discovery systems
+VALUABLE_PLANET_CLASSES = frozenset({'Earthlike body', 'Water world', 'Ammonia world'})
+
+# Per-file exploration counts: path -> (mtime_ns, size, stats). One entry per
+# file, so rewrites of the live journal replace its entry instead of piling up
+_file_stats: Dict[Path, Tuple[int, int, 'ExplorationFileStats']] = {}
+
+# Parsed journal events used by the exploration endpoints, shared between requests
+exploration_cache = JournalCache(
+    EXPLORATION_EVENTS,
+    intern_fields=(
+        'StarSystem', 'ScanType', 'PlanetClass', 'StarType', 'TerraformState',
+        'Atmosphere', 'Volcanism', 'Luminosity'
+    )
+)
+
+
+class CurrentSystemScans:
+    """
+    The commander's current system and the bodies scanned in it.
+
+    Built from one pass over a journal file and shared by the current-system
+    endpoints, so it must not be modified.
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]]):
+        """
+        Find the current system in a journal's events.
+
+        Args:
+            events: Exploration events in file order
+        """
+        self.system_name: Optional[str] = None
+        self.system_address: Optional[int] = None
+        self.fss_body_count = 0
+        # Scan events for bodies in the current system, in file order
+        self.scans: List[Dict[str, Any]] = []
+
+        for data in events:
+            get = data.get
+            event = get('event')
+
+            # Track system changes
+            if event in SYSTEM_EVENTS:
+                self.system_name = get('StarSystem')
+                self.system_address = get('SystemAddress')
+                self.fss_body_count = 0
+                self.scans = []
+
+            # Track FSS discovery scan
+            elif event == 'FSSDiscoveryScan' and get('SystemAddress') == self.system_address:
+                self.fss_body_count = get('BodyCount', 0)
+
+            # Track body scans
+            elif event == 'Scan' and get('SystemAddress') == self.system_address:
+                self.scans.append(data)
+
+
+def get_current_system_scans(journal_file: Path) -> CurrentSystemScans:
+    """
+    Get the current system and its scans from a journal file.
+
+    Results are cached against the file's modification time and size, so
+    the current-system endpoints share one pass until the game writes again.
+
+    Args:
+        journal_file: Latest journal file
+
+    Returns:
+        Shared current system scans
+    """
+    stat = journal_file.stat()
+    return _current_system_scans_cached(journal_file, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4)
+def _current_system_scans_cached(journal_file: Path, mtime_ns: int, size: int) -> CurrentSystemScans:
+    """Find the current system in a journal file, keyed on its stats."""
+    return CurrentSystemScans(exploration_cache.load(journal_file))
+
+
+class ExplorationFileStats:
+    """
+    Exploration counts for a single journal file.
+
+    Statistics over many journals are merged from these, so a journal that
+    hasn't changed is never walked again. Instances are shared between
+    requests and must not be modified.
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]]):
+        """
+        Count the exploration events of one journal.
+
+        Args:
+            events: Exploration events in file order
+        """
+        self.systems_visited = set()
+        self.total_scans = 0
+        self.first_discoveries = 0
+        self.first_mapped = 0
+        self.first_footfall = 0
+        self.planet_types = Counter()
+        self.star_types = Counter()
+        self.landable_count = 0
+        self.terraformable_count = 0
+
+        for data in events:
+            get = data.get
+            event = get('event')
+
+            if event in SYSTEM_EVENTS:
+                system = get('StarSystem')
+                if system:
+                    self.systems_visited.add(system)
+
+            elif event == 'Scan':
+                self.total_scans += 1
+
+                if not get('WasDiscovered', True):
+                    self.first_discoveries += 1
+                if not get('WasMapped', True):
+                    self.first_mapped += 1
+                if not get('WasFootfalled', True):
+                    self.first_footfall += 1
+
+                planet_class = get('PlanetClass')
+                if planet_class:
+                    self.planet_types[planet_class] += 1
+
+                star_type = get('StarType')
+                if star_type:
+                    self.star_types[star_type] += 1
+
+                if get('Landable'):
+                    self.landable_count += 1
+                if get('TerraformState'):
+                    self.terraformable_count += 1
+
+        # Lowercased system names, so a system search can skip this file
+        self.system_names_lower = frozenset(system.lower() for system in self.systems_visited)
+
+
+def get_file_stats(journal_file: Path) -> ExplorationFileStats:
+    """
+    Get the exploration counts for a journal file.
+
+    Counts are cached per file against its modification time and size,
+    keeping only the latest counts for each file.
+
+    Args:
+        journal_file: Path to the journal file
+
+    Returns:
+        Shared counts for the file
+    """
+    stat = journal_file.stat()
+
+    cached = _file_stats.get(journal_file)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    stats = ExplorationFileStats(exploration_cache.load(journal_file))
+    _file_stats[journal_file] = (stat.st_mtime_ns, stat.st_size, stats)
+    return stats
+
+
+class DiscoveredSystem:
+    """A visited system's details and the bodies scanned in it."""
+
+    __slots__ = (
+        'system_name', 'system_address', 'visit_timestamp', 'fss_body_count', 'scans',
+        'first_discoveries', 'first_mapped', 'first_footfall', 'valuable_finds'
+    )
+
+    def __init__(self):
+        self.system_name = ''
+        self.system_address = 0
+        self.visit_timestamp = ''
+        self.fss_body_count = 0
+        # Scan events for the system's bodies, in file order
+        self.scans: List[Dict[str, Any]] = []
+        self.first_discoveries = 0
+        self.first_mapped = 0
+        self.first_footfall = 0
+        # Valuable planet classes in the order they were found
+        self.valuable_finds: List[str] = []
+
+
+class FirstDiscoveryScan:
+    """
+    The systems visited across a set of journal files, with their scans.
+
+    Shared by the first discovery report and system list, which only
+    differ in how they present it, so a call to one after the other
+    reuses the same pass. Instances are cached and must not be modified.
+    """
+
+    def __init__(self, journal_files: Iterable[Path]):
+        """
+        Gather the visited systems from journal files.
+
+        Args:
+            journal_files: Journal files in the order to read them
+        """
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+        self.systems: Dict[int, DiscoveredSystem] = {}
+
+        for journal_file in journal_files:
+            system_address = None
+
+            for data in exploration_cache.load(journal_file):
+                get = data.get
+                event = get('event')
+                timestamp = get('timestamp')
+
+                if not self.first_timestamp:
+                    self.first_timestamp = timestamp
+                self.last_timestamp = timestamp
+
+                # Track system entry
+                if event in SYSTEM_EVENTS:
+                    current_system = get('StarSystem')
+                    system_address = get('SystemAddress')
+
+                    if system_address and current_system:
+                        system = self._get_system(system_address)
+                        system.system_name = current_system
+                        system.system_address = system_address
+                        system.visit_timestamp = timestamp
+
+                # Track FSS scan
+                elif event == 'FSSDiscoveryScan' and system_address:
+                    self._get_system(system_address).fss_body_count = get('BodyCount', 0)
+
+                # Track body scans
+                elif event == 'Scan' and system_address:
+                    system = self._get_system(system_address)
+                    system.scans.append(data)
+
+                    # The game writes these flags as booleans; a missing flag is
+                    # not a first, so only an explicit False counts
+                    if get('WasDiscovered') is False:
+                        system.first_discoveries += 1
+                    if get('WasMapped') is False:
+                        system.first_mapped += 1
+                    if get('WasFootfalled') is False:
+                        system.first_footfall += 1
+
+                    planet_class = get('PlanetClass')
+                    if planet_class in VALUABLE_PLANET_CLASSES and planet_class not in system.valuable_finds:
+                        system.valuable_finds.append(planet_class)
+
+    def _get_system(self, system_address: int) -> DiscoveredSystem:
+        """Get a system's record, adding it on the first visit."""
+        system = self.systems.get(system_address)
+        if system is None:
+            system = self.systems[system_address] = DiscoveredSystem()
+        return system
+
+
+def get_first_discovery_scan(journal_files: List[Path]) -> FirstDiscoveryScan:
+    """
+    Get the visited systems across journal files.
+
+    The result is cached against every file's modification time and size,
+    so repeated first discovery requests over unchanged journals share it.
+
+    Args:
+        journal_files: Journal files in the order to read them
+
+    Returns:
+        Shared first discovery scan
+    """
+    file_stats = []
+    for journal_file in journal_files:
+        stat = journal_file.stat()
+        file_stats.append((journal_file, stat.st_mtime_ns, stat.st_size))
+
+    return _first_discovery_scan_cached(tuple(file_stats))
+
+
+# Kept for the latest journal alone and for all journals
+@lru_cache(maxsize=2)
+def _first_discovery_scan_cached(file_stats: Tuple[Tuple[Path, int, int], ...]) -> FirstDiscoveryScan:
+    """Gather the visited systems from journal files, keyed on their stats."""
+    return FirstDiscoveryScan(journal_file for journal_file, _, _ in file_stats)
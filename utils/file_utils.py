@@ -1,10 +1,24 @@
 import json
+import time
+import asyncio
 import logging
+import threading
+import orjson
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Iterable
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached JSON file is trusted before its stat is checked again
+JSON_CACHE_TTL = 0.25
+
+# Seconds between background refreshes, kept under the TTL so the cache stays warm
+JSON_WATCH_INTERVAL = 0.2
+
+# Parsed JSON files: path -> (checked at, mtime_ns, size, data)
+_json_cache: Dict[Path, Tuple[float, int, int, Dict[str, Any]]] = {}
+_json_cache_lock = threading.Lock()
+
 
 def read_json_file(filepath: Path) -> Optional[Dict[str, Any]]:
     """
@@ -17,12 +31,13 @@ def read_json_file(filepath: Path) -> Optional[Dict[str, Any]]:
         Parsed JSON data or None if error occurs
     """
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        # Single binary read; orjson decodes the UTF-8 itself
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         logger.error(f"File not found: {filepath}")
         return None
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Invalid JSON in {filepath}: {e}")
         return None
     except Exception as e:
@@ -30,6 +45,119 @@ def read_json_file(filepath: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
+def read_json_file_cached(filepath: Path, ttl: float = JSON_CACHE_TTL) -> Optional[Dict[str, Any]]:
+    """
+    Read and parse a JSON file, reusing the result while the file is unchanged.
+
+    Within ttl seconds of the last check the cached data is returned without
+    touching the disk. After that the file is only re-parsed if its
+    modification time or size changed. Concurrent misses share one parse.
+
+    Args:
+        filepath: Path to the JSON file
+        ttl: Seconds to trust the cached data without checking the file
+
+    Returns:
+        Parsed JSON data or None if error occurs. The data is shared
+        between callers and must not be modified.
+    """
+    entry = _get_json_cache_entry(filepath, ttl)
+    return entry[3] if entry is not None else None
+
+
+def read_json_file_with_etag(
+        filepath: Path,
+        ttl: float = JSON_CACHE_TTL
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Read a JSON file through the cache along with an ETag for its contents.
+
+    The ETag is built from the modification time and size the data was
+    parsed at, so it only changes when the game rewrites the file.
+
+    Args:
+        filepath: Path to the JSON file
+        ttl: Seconds to trust the cached data without checking the file
+
+    Returns:
+        Tuple of the parsed JSON data and its weak ETag, or (None, None)
+        if the file can't be read
+    """
+    entry = _get_json_cache_entry(filepath, ttl)
+    if entry is None:
+        return None, None
+
+    return entry[3], f'W/"{entry[1]:x}-{entry[2]:x}"'
+
+
+def _get_json_cache_entry(
+        filepath: Path,
+        ttl: float
+) -> Optional[Tuple[float, int, int, Dict[str, Any]]]:
+    """Get the up to date cache entry for a JSON file, or None if it can't be read."""
+    cached = _json_cache.get(filepath)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached
+
+    with _json_cache_lock:
+        now = time.monotonic()
+
+        # Another thread may have refreshed the entry while we waited
+        cached = _json_cache.get(filepath)
+        if cached is not None and now - cached[0] < ttl:
+            return cached
+
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            logger.error(f"File not found: {filepath}")
+            _json_cache.pop(filepath, None)
+            return None
+
+        if cached is not None and cached[1] == stat.st_mtime_ns and cached[2] == stat.st_size:
+            data = cached[3]
+        else:
+            data = read_json_file(filepath)
+
+        # Don't cache failures, the game may be part way through writing
+        if data is None:
+            return None
+
+        entry = _json_cache[filepath] = (now, stat.st_mtime_ns, stat.st_size, data)
+        return entry
+
+
+async def watch_json_files(filepaths: Iterable[Path], interval: float = JSON_WATCH_INTERVAL):
+    """
+    Keep the cached copies of frequently polled JSON files fresh.
+
+    Each file is checked more often than JSON_CACHE_TTL expires, so
+    read_json_file_cached answers requests from memory without a stat or a
+    parse on the request path. Files the game hasn't written yet are skipped.
+    Runs until cancelled.
+
+    Args:
+        filepaths: JSON files to keep cached
+        interval: Seconds to wait between checks
+    """
+    filepaths = tuple(filepaths)
+
+    while True:
+        try:
+            await asyncio.to_thread(_refresh_json_files, filepaths)
+        except Exception as e:
+            logger.error(f"Error watching JSON files: {e}")
+
+        await asyncio.sleep(interval)
+
+
+def _refresh_json_files(filepaths: Iterable[Path]):
+    """Re-check every existing file, re-parsing those that changed."""
+    for filepath in filepaths:
+        if filepath.exists():
+            read_json_file_cached(filepath, ttl=0)
+
+
 def write_json_file(filepath: Path, data: Any, append: bool = False) -> bool:
     """
     Write data to a JSON file.
@@ -1,12 +1,29 @@
-import json
-import glob
+import os
+import re
+import sys
+import mmap
+import time
+import asyncio
 import logging
+import threading
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
-from collections import defaultdict
+from typing import List, Dict, Any, Optional, Callable, Iterator, Iterable, Tuple, Union
+from collections import Counter
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Seconds between checks of the latest journal for new lines
+JOURNAL_POLL_INTERVAL = 1.0
+
+# Seconds a journal directory listing is trusted before the directory is checked again
+JOURNAL_LIST_TTL = 2.0
+
+# Events that move the commander to a new system
+SYSTEM_EVENTS = frozenset({'FSDJump', 'Location', 'CarrierJump'})
+
 
 def get_latest_journal_file(json_location: Path) -> Optional[Path]:
     """
@@ -19,62 +36,259 @@ def get_latest_journal_file(json_location: Path) -> Optional[Path]:
         Path to the latest journal file or None
     """
     try:
-        pattern = str(json_location / 'Journal*.log')
-        files = sorted(glob.iglob(pattern), key=lambda x: Path(x).stat().st_ctime, reverse=True)
-        return Path(files[0]) if files else None
+        files = _get_journal_listing(json_location)
+        return files[-1] if files else None
     except Exception as e:
         logger.error(f"Error getting latest journal file: {e}")
         return None
 
 
-def get_all_journal_files(json_location: Path, reverse: bool = False) -> List[Path]:
+def get_all_journal_files(
+        json_location: Path,
+        reverse: bool = False,
+        since: Optional[float] = None
+) -> List[Path]:
     """
     Get all journal files sorted by creation time.
 
+    The listing is cached against the directory's modification time, which
+    only changes when files are added, removed or renamed, and the directory
+    itself is checked at most every JOURNAL_LIST_TTL seconds.
+
     Args:
         json_location: Directory containing journal files
         reverse: If True, sort newest first
+        since: If given, only include files modified at or after this UNIX time
 
     Returns:
         List of journal file paths
     """
     try:
-        pattern = str(json_location / 'Journal*.log')
-        files = sorted(
-            glob.glob(pattern),
-            key=lambda x: Path(x).stat().st_ctime,
-            reverse=reverse
-        )
-        return [Path(f) for f in files]
+        files = _get_journal_listing(json_location)
+        if since is not None:
+            files = [filepath for filepath in files if _modified_since(filepath, since)]
+        return list(reversed(files)) if reverse else list(files)
     except Exception as e:
         logger.error(f"Error getting journal files: {e}")
         return []
 
 
-def parse_journal_line(line: str) -> Optional[Dict[str, Any]]:
+def get_journal_files(json_location: Path, scan_all_logs: bool, since: Optional[float] = None) -> List[Path]:
+    """
+    Get the journal files a query should read.
+
+    Args:
+        json_location: Directory containing journal files
+        scan_all_logs: If True, use every journal file instead of the latest
+        since: If given with scan_all_logs, only include files modified at or
+            after this UNIX time
+
+    Returns:
+        List of journal file paths
+    """
+    if scan_all_logs:
+        return get_all_journal_files(json_location, since=since)
+
+    latest = get_latest_journal_file(json_location)
+    return [latest] if latest else []
+
+
+def get_journal_etag(json_location: Path, journal_files: Optional[List[Path]] = None) -> Optional[str]:
+    """
+    Get an ETag covering the journal files in a directory.
+
+    The game only ever appends to the newest journal, so the number of
+    journals and the newest one's modification time and size change
+    whenever any query over them could give a different answer.
+
+    Args:
+        json_location: Directory containing journal files
+        journal_files: Files a response was built from when they're a subset
+            picked by something other than the directory's contents, such as
+            a time window; their count is added to the tag
+
+    Returns:
+        Weak ETag, or None if there are no journal files
+    """
+    try:
+        files = _get_journal_listing(json_location)
+        if not files:
+            return None
+        stat = files[-1].stat()
+    except Exception as e:
+        logger.error(f"Error getting journal ETag: {e}")
+        return None
+
+    etag = f'{len(files):x}-{stat.st_mtime_ns:x}-{stat.st_size:x}'
+    if journal_files is not None:
+        # Files leave a time window as it moves, even while the game is idle
+        etag += f'-{len(journal_files):x}'
+
+    return f'W/"{etag}"'
+
+
+# Recent directory listings: directory -> (checked at, journal files oldest first)
+_journal_listings: Dict[str, Tuple[float, Tuple[Path, ...]]] = {}
+
+
+def _get_journal_listing(json_location: Path) -> Tuple[Path, ...]:
+    """Get the journal files in a directory oldest first, re-checking it at most every JOURNAL_LIST_TTL."""
+    key = str(json_location)
+    now = time.monotonic()
+
+    cached = _journal_listings.get(key)
+    if cached is not None and now - cached[0] < JOURNAL_LIST_TTL:
+        return cached[1]
+
+    files = _list_journal_files(key, os.stat(key).st_mtime_ns)
+    _journal_listings[key] = (now, files)
+    return files
+
+
+def _modified_since(filepath: Path, since: float) -> bool:
+    """Check whether a file was modified at or after a UNIX time, treating missing files as not."""
+    try:
+        return filepath.stat().st_mtime >= since
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=4)
+def _list_journal_files(json_location: str, dir_mtime_ns: int) -> Tuple[Path, ...]:
+    """List the journal files in a directory oldest first, keyed on its mtime."""
+    # DirEntry caches its stat result, so sorting costs no extra syscalls
+    # on Windows where the directory listing already includes it
+    with os.scandir(json_location) as entries:
+        files = sorted(
+            (entry for entry in entries
+             if entry.name.startswith('Journal') and entry.name.endswith('.log') and entry.is_file()),
+            key=lambda entry: entry.stat().st_ctime
+        )
+    return tuple(Path(entry.path) for entry in files)
+
+
+def event_tag(event_name: str) -> str:
+    """
+    Get the text identifying an event in a raw journal line.
+
+    The game always writes the event key without whitespace, so checking a
+    line for this tag is a cheap way to skip lines before parsing them.
+
+    Args:
+        event_name: Name of the event
+
+    Returns:
+        Tag such as '"event":"Docked"'
+    """
+    return f'"event":"{event_name}"'
+
+
+def parse_journal_line(line: Union[str, bytes]) -> Optional[Dict[str, Any]]:
     """
     Parse a single line from a journal file.
 
     Args:
-        line: Line from journal file
+        line: Line from journal file, either text or raw bytes
 
     Returns:
         Parsed JSON data or None if invalid
     """
-    line = line.strip()
-    if not line or not line.startswith('{'):
+    # Lines are checked in place instead of stripped into a copy; journal
+    # lines start with '{' and orjson ignores the trailing line ending
+    if line[:1] not in ('{', b'{'):
         return None
 
     try:
-        return json.loads(line)
-    except json.JSONDecodeError:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
         return None
 
 
+def iter_lines_reverse(
+        filepath: Path,
+        chunk_size: int = 65536,
+        start: int = 0,
+        end: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Iterate over the lines of a file from last to first.
+
+    Reads the file backwards in fixed-size chunks so callers looking for
+    recent events only touch the tail of the file.
+
+    Args:
+        filepath: Path to the file
+        chunk_size: Number of bytes to read per chunk
+        start: Offset to stop reading at, which should be the start of a line
+        end: Offset to start reading back from, defaults to the end of the file
+
+    Returns:
+        Iterator of raw lines, newest first. Lines are left as bytes for
+        parse_journal_line, which decodes them inside orjson.
+    """
+    with open(filepath, 'rb') as f:
+        position = f.seek(0, os.SEEK_END) if end is None else end
+        if position <= start:
+            return
+
+        remainder = b''
+
+        while position > start:
+            read_size = min(chunk_size, position - start)
+            position -= read_size
+            f.seek(position)
+
+            lines = (f.read(read_size) + remainder).split(b'\n')
+            # The first piece may be the tail of a line from an earlier chunk
+            remainder = lines.pop(0)
+
+            for line in reversed(lines):
+                yield line
+
+        yield remainder
+
+
+def iter_journal_lines(filepath: Path) -> Iterator[bytes]:
+    """
+    Iterate over the lines of a file from first to last.
+
+    The file is memory-mapped and split on newlines directly, bypassing the
+    buffered text layer so each line is handed to orjson as raw bytes.
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        Iterator of raw lines in file order
+    """
+    with open(filepath, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            find = mm.find
+            position = 0
+
+            while True:
+                newline = find(b'\n', position)
+                if newline < 0:
+                    yield mm[position:]
+                    return
+
+                yield mm[position:newline]
+                position = newline + 1
+
+
 def find_latest_event(json_location: Path, event_name: str) -> Optional[Dict[str, Any]]:
     """
     Find the most recent occurrence of a specific event.
 
+    Results are cached per journal file and event. Journals are only ever
+    appended to, so once the game writes more lines only those new lines are
+    scanned, falling back to the cached event if they don't contain one.
+    The returned dict is shared between callers and must not be modified.
+
     Args:
         json_location: Directory containing journal files
         event_name: Name of the event to find
@@ -87,17 +301,201 @@ def find_latest_event(json_location: Path, event_name: str) -> Optional[Dict[str
         return None
 
     try:
-        with open(journal_file, 'r') as f:
-            for line in reversed(list(f)):
-                data = parse_journal_line(line)
-                if data and data.get('event') == event_name:
-                    return data
+        size = journal_file.stat().st_size
+        key = (journal_file, event_name)
+
+        cached = _latest_events.get(key)
+        if cached is not None and cached[2] == size:
+            return cached[1]
+
+        # Resume after the lines already scanned unless the file shrank
+        if cached is not None and cached[0] <= size:
+            start, previous = cached[0], cached[1]
+        else:
+            start, previous = 0, None
+
+        data, scanned_to = _scan_for_latest_event(journal_file, event_name, start, size)
+        if data is None:
+            data = previous
+
+        with _latest_events_lock:
+            _latest_events[key] = (scanned_to, data, size)
+
+        return data
     except Exception as e:
         logger.error(f"Error reading journal file: {e}")
 
     return None
 
 
+# Latest event lookups: (journal, event) -> (scanned up to, event data, file size)
+_latest_events: Dict[Tuple[Path, str], Tuple[int, Optional[Dict[str, Any]], int]] = {}
+_latest_events_lock = threading.Lock()
+
+
+def _scan_for_latest_event(
+        journal_file: Path,
+        event_name: str,
+        start: int,
+        end: int
+) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    Scan the complete lines between two offsets backwards for an event.
+
+    The file is memory-mapped and searched for the event tag with rfind,
+    so only lines that contain the tag are ever sliced out and parsed.
+
+    Returns:
+        Tuple of the latest matching event or None, and the offset just past
+        the last complete line, where the next scan should resume
+    """
+    if end <= start:
+        return None, start
+
+    tag = event_tag(event_name).encode()
+
+    with open(journal_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = min(end, len(mm))
+
+        # Whatever follows the last newline may still be being written
+        scanned_to = mm.rfind(b'\n', start, end) + 1
+        if scanned_to == 0:
+            return None, start
+
+        position = scanned_to
+        while True:
+            found = mm.rfind(tag, start, position)
+            if found < 0:
+                return None, scanned_to
+
+            line_start = mm.rfind(b'\n', start, found) + 1 or start
+            line_end = mm.find(b'\n', found, scanned_to)
+
+            data = parse_journal_line(mm[line_start:line_end])
+            if data and data.get('event') == event_name:
+                return data, scanned_to
+
+            position = line_start
+
+
+class JournalCache:
+    """
+    Cache of parsed journal events, kept per file and refreshed incrementally.
+
+    Each cache only keeps the events it was created for. When a journal
+    grows, only the bytes appended since the last load are parsed.
+    Every cache is registered in JournalCache.instances so watch_journals
+    can keep it current in the background.
+    """
+
+    instances: 'weakref.WeakSet[JournalCache]' = weakref.WeakSet()
+
+    def __init__(self, event_names: Iterable[str], intern_fields: Iterable[str] = ()):
+        """
+        Initialize the cache.
+
+        Args:
+            event_names: Names of the events to keep
+            intern_fields: Fields whose string values repeat across events and
+                should share one interned string. 'event' is always interned.
+        """
+        self.event_names = frozenset(event_names)
+        self.intern_fields = ('event',) + tuple(field for field in intern_fields if field != 'event')
+        # Matches raw lines naming one of the tracked events
+        self._event_pattern = re.compile(b'|'.join(
+            re.escape(event_tag(name).encode()) for name in sorted(self.event_names)
+        ))
+        self._files: Dict[Path, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        JournalCache.instances.add(self)
+
+    def load(self, filepath: Path) -> List[Dict[str, Any]]:
+        """
+        Get the tracked events from a journal file.
+
+        Args:
+            filepath: Path to the journal file
+
+        Returns:
+            Events in file order. The list is shared and must not be modified.
+        """
+        stat = filepath.stat()
+
+        with self._lock:
+            entry = self._files.get(filepath)
+
+            # Start over for new files or files that were truncated/replaced
+            if entry is None or stat.st_size < entry['offset']:
+                entry = {'mtime_ns': None, 'size': None, 'offset': 0, 'events': []}
+                self._files[filepath] = entry
+
+            if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+                self._read_new_events(filepath, entry)
+                entry['mtime_ns'] = stat.st_mtime_ns
+                entry['size'] = stat.st_size
+
+            return entry['events']
+
+    def load_all(self, filepaths: Iterable[Path]) -> Iterator[Dict[str, Any]]:
+        """Iterate over the tracked events of several journal files in order."""
+        for filepath in filepaths:
+            yield from self.load(filepath)
+
+    def _read_new_events(self, filepath: Path, entry: Dict[str, Any]):
+        """Parse the complete lines appended since the last read."""
+        with open(filepath, 'rb') as f:
+            f.seek(entry['offset'])
+            data = f.read()
+
+        # Leave a partially written last line for the next read
+        end = data.rfind(b'\n') + 1
+        events = entry['events']
+
+        search = self._event_pattern.search
+        intern_fields = self.intern_fields
+        for line in data[:end].split(b'\n'):
+            # Only parse lines that name a tracked event
+            if not search(line):
+                continue
+
+            parsed = parse_journal_line(line)
+            if parsed and parsed.get('event') in self.event_names:
+                # Cached events live for the whole session, so repeated
+                # values are collapsed onto a single string object
+                for field in intern_fields:
+                    value = parsed.get(field)
+                    if type(value) is str:
+                        parsed[field] = sys.intern(value)
+
+                events.append(parsed)
+
+        entry['offset'] += end
+
+
+async def watch_journals(json_location: Path, interval: float = JOURNAL_POLL_INTERVAL):
+    """
+    Keep every JournalCache up to date with the latest journal file.
+
+    The game appends to its journal continuously, so polling the file and
+    loading new lines here means requests find the events already parsed.
+    Runs until cancelled.
+
+    Args:
+        json_location: Directory containing journal files
+        interval: Seconds to wait between checks
+    """
+    while True:
+        try:
+            journal_file = await asyncio.to_thread(get_latest_journal_file, json_location)
+            if journal_file:
+                for cache in list(JournalCache.instances):
+                    await asyncio.to_thread(cache.load, journal_file)
+        except Exception as e:
+            logger.error(f"Error watching journal files: {e}")
+
+        await asyncio.sleep(interval)
+
+
 def process_all_journals(
         json_location: Path,
         event_type: str,
@@ -116,19 +514,23 @@ def process_all_journals(
     """
     results = []
     journal_files = get_all_journal_files(json_location)
+    # Lines without the event's tag are skipped before parsing
+    tag = event_tag(event_type).encode()
 
     for filepath in journal_files:
         try:
-            with open(filepath, 'r') as f:
-                for line in f:
-                    entry = parse_journal_line(line)
-                    if entry and entry.get('event') == event_type:
-                        try:
-                            result = processor_func(entry, filepath)
-                            if result:
-                                results.append(result)
-                        except Exception as e:
-                            logger.error(f"Error processing event in {filepath}: {e}")
+            for line in iter_journal_lines(filepath):
+                if tag not in line:
+                    continue
+
+                entry = parse_journal_line(line)
+                if entry and entry.get('event') == event_type:
+                    try:
+                        result = processor_func(entry, filepath)
+                        if result:
+                            results.append(result)
+                    except Exception as e:
+                        logger.error(f"Error processing event in {filepath}: {e}")
         except IOError as e:
             logger.error(f"Error reading {filepath}: {e}")
 
@@ -145,27 +547,30 @@ def calculate_cargo_inventory(json_location: Path) -> Dict[str, int]:
     Returns:
         Dictionary with item types as keys and quantities as values
     """
-    inventory = defaultdict(int)
+    inventory = Counter()
     journal_files = get_all_journal_files(json_location)
+    tag = event_tag('CargoTransfer').encode()
 
     for filepath in journal_files:
         try:
-            with open(filepath, 'r') as f:
-                for line in f:
-                    entry = parse_journal_line(line)
-                    if not entry or entry.get('event') != 'CargoTransfer':
-                        continue
-
-                    transfers = entry.get('Transfers', [])
-                    for transfer in transfers:
-                        item_type = transfer.get('Type', '')
-                        count = transfer.get('Count', 0)
-                        direction = transfer.get('Direction', '')
-
-                        if direction == 'tocarrier':
-                            inventory[item_type] += count
-                        elif direction == 'toship':
-                            inventory[item_type] -= count
+            for line in iter_journal_lines(filepath):
+                if tag not in line:
+                    continue
+
+                entry = parse_journal_line(line)
+                if not entry or entry.get('event') != 'CargoTransfer':
+                    continue
+
+                transfers = entry.get('Transfers', [])
+                for transfer in transfers:
+                    item_type = transfer.get('Type', '')
+                    count = transfer.get('Count', 0)
+                    direction = transfer.get('Direction', '')
+
+                    if direction == 'tocarrier':
+                        inventory[item_type] += count
+                    elif direction == 'toship':
+                        inventory[item_type] -= count
         except Exception as e:
             logger.error(f"Error processing {filepath}: {e}")
 
@@ -1,7 +1,8 @@
+import math
 import logging
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from utils.journal import get_latest_journal_file, parse_journal_line
+from utils.journal import get_latest_journal_file, parse_journal_line, iter_lines_reverse, event_tag
 
 logger = logging.getLogger(__name__)
 
@@ -11,9 +12,9 @@ def calculate_distance(pos1: List[float], pos2: List[float]) -> float:
     if len(pos1) != 3 or len(pos2) != 3:
         return 0.0
 
-    return ((pos1[0] - pos2[0]) ** 2 +
-            (pos1[1] - pos2[1]) ** 2 +
-            (pos1[2] - pos2[2]) ** 2) ** 0.5
+    x1, y1, z1 = pos1
+    x2, y2, z2 = pos2
+    return math.hypot(x1 - x2, y1 - y2, z1 - z2)
 
 
 def get_visited_systems(json_location: Path, limit: int = 50) -> List[str]:
@@ -23,18 +24,24 @@ def get_visited_systems(json_location: Path, limit: int = 50) -> List[str]:
         return []
 
     systems = []
+    seen = set()
+    tag = event_tag('FSDJump').encode()
 
     try:
-        with open(journal_file, 'r', encoding='utf-8') as f:
-            for line in reversed(list(f)):
-                if len(systems) >= limit:
-                    break
-
-                data = parse_journal_line(line)
-                if data and data.get('event') == 'FSDJump':
-                    system = data.get('StarSystem')
-                    if system and system not in systems:
-                        systems.append(system)
+        # Read from the end so only the tail of the journal is touched
+        for line in iter_lines_reverse(journal_file):
+            if len(systems) >= limit:
+                break
+
+            if tag not in line:
+                continue
+
+            data = parse_journal_line(line)
+            if data and data.get('event') == 'FSDJump':
+                system = data.get('StarSystem')
+                if system and system not in seen:
+                    seen.add(system)
+                    systems.append(system)
     except Exception as e:
         logger.error(f"Error getting visited systems: {e}")
 
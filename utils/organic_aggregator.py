@@ -0,0 +1,214 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Tuple
+from collections import Counter
+
+from utils.journal import JournalCache, SYSTEM_EVENTS
+
+# Parsed journal events used by the organics endpoints, shared between requests
+organics_cache = JournalCache(
+    SYSTEM_EVENTS | {'Disembark', 'ScanOrganic'},
+    intern_fields=(
+        'StarSystem', 'Body', 'ScanType',
+        'Genus', 'Genus_Localised', 'Species', 'Species_Localised', 'Variant', 'Variant_Localised'
+    )
+)
+
+
+class OrganicAggregate:
+    """
+    Organic scan totals and groupings for a set of journal files.
+
+    Everything is built in a single pass over the events, so each organics
+    view is just a projection of these attributes. Aggregates are shared
+    between requests and must not be modified.
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]]):
+        """
+        Build the aggregate.
+
+        Args:
+            events: Journal events in file order
+        """
+        self.total_analyse = 0
+        self.total_log = 0
+        self.first_discovery_count = 0
+        self.genus_counter = Counter()
+        self.species_counter = Counter()
+        self.variant_counter = Counter()
+        self.systems_with_organics = set()
+        self.bodies_with_organics = set()
+
+        # Most scanned genus and species, the first keys of the distributions
+        self.most_common_genus = "None"
+        self.most_common_species = "None"
+        # Scan counts ordered from most to least common
+        self.genus_distribution: Dict[str, int] = {}
+        self.species_distribution: Dict[str, int] = {}
+
+        # Per-genus species and first discoveries; scan counts are genus_counter
+        self.species_by_genus: Dict[str, set] = {}
+        self.first_discoveries_by_genus = Counter()
+        # System name -> scan summary for the system
+        self.by_system: Dict[str, Dict[str, Any]] = {}
+        # First-discovery scans, in the shape of the OrganicScan model
+        self.first_discoveries: List[Dict[str, Any]] = []
+
+        self._add_events(events)
+
+    def _add_events(self, events: Iterable[Dict[str, Any]]):
+        """Walk the events once, updating every view."""
+        systems = {}
+        genus_counter = self.genus_counter
+        species_counter = self.species_counter
+        species_by_genus = self.species_by_genus
+
+        current_system = None
+        system_address = None
+        current_body = None
+        current_body_id = None
+
+        for data in events:
+            get = data.get
+            event = get('event')
+
+            if event in SYSTEM_EVENTS:
+                current_system = get('StarSystem')
+                system_address = get('SystemAddress')
+                current_body = get('Body')
+                current_body_id = get('BodyID')
+
+            elif event == 'Disembark':
+                current_body = get('Body')
+                current_body_id = get('BodyID')
+
+            elif event == 'ScanOrganic':
+                scan_type = get('ScanType')
+                was_logged = get('WasLogged', False)
+                first_discovery = scan_type == 'Analyse' and not was_logged
+
+                genus = get('Genus_Localised') or get('Genus', '')
+                species = get('Species_Localised') or get('Species', '')
+                variant = get('Variant_Localised') or get('Variant', '')
+
+                # Overall totals
+                if scan_type == 'Analyse':
+                    self.total_analyse += 1
+                    if not was_logged:
+                        self.first_discovery_count += 1
+                elif scan_type == 'Log':
+                    self.total_log += 1
+
+                if genus:
+                    genus_counter[genus] += 1
+                if species:
+                    species_counter[species] += 1
+                if variant:
+                    self.variant_counter[variant] += 1
+
+                if current_system:
+                    self.systems_with_organics.add(current_system)
+                if current_body:
+                    self.bodies_with_organics.add(f"{current_system}:{current_body}")
+
+                # By genus
+                if genus:
+                    genus_species = species_by_genus.get(genus)
+                    if genus_species is None:
+                        genus_species = species_by_genus[genus] = set()
+
+                    if species:
+                        genus_species.add(species)
+                    if first_discovery:
+                        self.first_discoveries_by_genus[genus] += 1
+
+                # First discoveries
+                if first_discovery:
+                    self.first_discoveries.append({
+                        'timestamp': get('timestamp'),
+                        'scan_type': scan_type,
+                        'genus': genus,
+                        'species': species,
+                        'variant': variant,
+                        'system_name': current_system,
+                        'system_address': system_address,
+                        'body_name': current_body,
+                        'body_id': current_body_id or get('Body'),
+                        'was_logged': False
+                    })
+
+                # By system
+                if current_system:
+                    system = systems.get(current_system)
+                    if system is None:
+                        system = systems[current_system] = {
+                            'system_name': current_system,
+                            'system_address': None,
+                            'scans': [],
+                            'unique_species': set(),
+                            'unique_genus': set(),
+                            'first_discoveries': 0
+                        }
+
+                    system['system_address'] = system_address
+                    system['scans'].append({
+                        'timestamp': get('timestamp'),
+                        'scan_type': scan_type,
+                        'genus': genus,
+                        'species': species,
+                        'variant': variant,
+                        'body_name': current_body,
+                        'was_logged': was_logged
+                    })
+
+                    if genus:
+                        system['unique_genus'].add(genus)
+                    if species:
+                        system['unique_species'].add(species)
+                    if first_discovery:
+                        system['first_discoveries'] += 1
+
+        # Sorted once here so requests can hand the distributions out as-is
+        self.genus_distribution = dict(genus_counter.most_common())
+        self.species_distribution = dict(species_counter.most_common())
+        self.most_common_genus = next(iter(self.genus_distribution), "None")
+        self.most_common_species = next(iter(self.species_distribution), "None")
+
+        # Convert sets to counts for the by-system view
+        for system_name, system_data in systems.items():
+            self.by_system[system_name] = {
+                'system_name': system_data['system_name'],
+                'system_address': system_data['system_address'],
+                'total_scans': len(system_data['scans']),
+                'unique_genus': len(system_data['unique_genus']),
+                'unique_species': len(system_data['unique_species']),
+                'first_discoveries': system_data['first_discoveries'],
+                'scans': system_data['scans']
+            }
+
+
+def aggregate_organics(journal_files: List[Path]) -> OrganicAggregate:
+    """
+    Get the organic scan aggregate for a set of journal files.
+
+    Aggregates are cached against the files' modification times and sizes,
+    so the organics views share one pass until the game writes to a file.
+
+    Args:
+        journal_files: Journal files in chronological order
+
+    Returns:
+        Shared aggregate of the organic scans in the files
+    """
+    file_stats = tuple((stat.st_mtime_ns, stat.st_size) for stat in (path.stat() for path in journal_files))
+    return _aggregate_organics_cached(tuple(journal_files), file_stats)
+
+
+@lru_cache(maxsize=4)
+def _aggregate_organics_cached(
+        journal_files: Tuple[Path, ...],
+        file_stats: Tuple[Tuple[int, int], ...]
+) -> OrganicAggregate:
+    """Build the aggregate for a set of journal files, keyed on their stats."""
+    return OrganicAggregate(organics_cache.load_all(journal_files))